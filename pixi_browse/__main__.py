@@ -7,6 +7,7 @@ from rattler.platform import Platform
 
 from pixi_browse import __version__
 from pixi_browse.models import VersionEntry, VersionRow
+from pixi_browse.platform_utils import parse_platform
 from pixi_browse.tui import CondaMetadataTui
 
 __all__ = [
@@ -63,8 +64,10 @@ def run(
     requested_matchspec: MatchSpec | None = None
     if platform is not None:
         try:
+            # Repeated flags name the same platform, so parse each name once.
             requested_platforms = [
-                Platform(platform_name) for platform_name in platform
+                parse_platform(platform_name)
+                for platform_name in dict.fromkeys(platform)
             ]
         except ParsePlatformError as exc:
             typer.echo(str(exc), err=True)
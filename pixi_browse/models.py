@@ -14,7 +14,7 @@ PackageFilePathType = Literal["hardlink", "softlink", "directory"]
 MetadataRow = tuple[str, str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VersionEntry:
     version: Version
     build: str
@@ -23,14 +23,14 @@ class VersionEntry:
     file_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VersionRow:
     kind: VersionRowKind
     subdir: str | None = None
     entry: VersionEntry | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackageFile:
     path: str
     size_in_bytes: int | None = None
@@ -62,7 +62,7 @@ class CompareSelection:
     entry: VersionEntry
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompareRow:
     label: str
     left: str
@@ -70,7 +70,7 @@ class CompareRow:
     changed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompareFileRow:
     label: str
     left: str
@@ -1,8 +1,33 @@
 from __future__ import annotations
 
+from functools import cache
+
 from rattler.platform import Platform
 
 
-def platform_sort_key(platform: Platform) -> tuple[bool, str]:
+@cache
+def parse_platform(platform_name: str) -> Platform:
+    return Platform(platform_name)
+
+
+def _platform_name_sort_key(platform: Platform) -> tuple[bool, str]:
     platform_name = str(platform)
     return (platform_name == "noarch", platform_name)
+
+
+ALL_PLATFORMS_SORTED: tuple[Platform, ...] = tuple(
+    sorted(Platform.all(), key=_platform_name_sort_key)
+)
+
+# `Platform.all()` is exhaustive, so every platform's name and rank can be
+# looked up here instead of crossing into rattler on every render or sort.
+PLATFORM_NAMES: dict[Platform, str] = {
+    platform: str(platform) for platform in ALL_PLATFORMS_SORTED
+}
+_PLATFORM_SORT_INDEX: dict[Platform, int] = {
+    platform: index for index, platform in enumerate(ALL_PLATFORMS_SORTED)
+}
+
+
+def platform_sort_key(platform: Platform) -> int:
+    return _PLATFORM_SORT_INDEX[platform]
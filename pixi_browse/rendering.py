@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
@@ -10,7 +11,7 @@ from rattler.match_spec import MatchSpec
 from rattler.package import RunExportsJson
 from rattler.repo_data import RepoDataRecord
 from rattler.version import VersionWithSource
-from rich.markup import escape
+from rich.markup import escape as rich_escape
 
 from pixi_browse.models import (
     CompareFileRow,
@@ -22,6 +23,8 @@ from pixi_browse.models import (
     VersionCompareData,
 )
 
+_BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB", "PiB")
+
 
 def _provenance_link(remote_url: str | None, sha: str | None) -> tuple[str, str] | None:
     if not remote_url or not sha:
@@ -35,15 +38,29 @@ def _provenance_link(remote_url: str | None, sha: str | None) -> tuple[str, str]
     return f"{remote_url}@{sha}", remote_url
 
 
+def _escape(markup: str) -> str:
+    # rich's escape only rewrites `[` tags and a trailing backslash; most
+    # versions, builds and names contain neither, so skip its regex pass.
+    if "[" not in markup and not markup.endswith("\\"):
+        return markup
+    return rich_escape(markup)
+
+
+@lru_cache(maxsize=256)
+def _label_column(label: str, width: int) -> str:
+    return f"{label:<{width}}  "
+
+
 def format_detail_rows(rows: Sequence[tuple[str, str]]) -> list[str]:
     if not rows:
         return []
     label_width = max(len(label) for label, _ in rows)
-    return [f"{label:<{label_width}}  {value}" for label, value in rows]
+    # Labels come from a small fixed set, so reuse their padded column.
+    return [_label_column(label, label_width) + value for label, value in rows]
 
 
 def format_clickable_url(url: str) -> str:
-    return format_clickable_link(escape(url), url)
+    return format_clickable_link(_escape(url), url)
 
 
 def format_clickable_link(label: str, url: str) -> str:
@@ -53,7 +70,7 @@ def format_clickable_link(label: str, url: str) -> str:
 def format_clickable_github_handle(handle: str) -> str:
     normalized = handle.lstrip("@")
     return format_clickable_link(
-        f"@{escape(normalized)}",
+        f"@{_escape(normalized)}",
         f"https://github.com/{normalized}",
     )
 
@@ -71,25 +88,25 @@ def _clickable_provenance_value(remote_url: str | None, sha: str | None) -> str
     if provenance_link is None:
         return None
     label, commit_url = provenance_link
-    return format_clickable_link(escape(label), commit_url)
+    return format_clickable_link(_escape(label), commit_url)
 
 
 def _format_url_value(url: str, *, clickable: bool) -> str:
     if clickable:
         return format_clickable_url(url)
-    return escape(url)
+    return _escape(url)
 
 
 def _format_url_list_value(urls: Sequence[str], *, clickable: bool) -> str:
     if clickable:
         return _clickable_url_list_value(urls)
-    return ", ".join(escape(url) for url in urls)
+    return ", ".join(_escape(url) for url in urls)
 
 
 def _format_recipe_maintainers_value(handles: Sequence[str], *, clickable: bool) -> str:
     if clickable:
         return _clickable_recipe_maintainers_value(handles)
-    return ", ".join(escape(handle) for handle in handles)
+    return ", ".join(_escape(handle) for handle in handles)
 
 
 def _format_provenance_value(
@@ -102,27 +119,74 @@ def _format_provenance_value(
     if provenance_link is None:
         return None
     label, _commit_url = provenance_link
-    return escape(label)
+    return _escape(label)
+
+
+@lru_cache(maxsize=8192)
+def _format_text_value(text: str) -> str:
+    if text == "NoArchType(None)":
+        return "none"
+    return _escape(text)
+
+
+def _format_list_value(value: list[Any]) -> str:
+    if not value:
+        return "none"
+    return ", ".join(str(item) for item in value)
+
+
+def _format_int_value(value: int) -> str:
+    return _format_text_value(str(value))
+
+
+# Exact-type dispatch for the common record field types. Anything else, such as
+# subclasses or timestamps, goes through the generic checks below.
+_RECORD_VALUE_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    type(None): lambda _value: "not available",
+    str: _format_text_value,
+    bytes: bytes.hex,
+    list: _format_list_value,
+    int: _format_int_value,
+}
 
 
 def format_record_value(value: Any) -> str:
-    if value is None:
-        return "not available"
+    formatter = _RECORD_VALUE_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
     if isinstance(value, bytes):
         return value.hex()
     if isinstance(value, list):
-        if not value:
-            return "none"
-        return ", ".join(str(item) for item in value)
+        return _format_list_value(value)
     if hasattr(value, "isoformat"):
         try:
             return value.isoformat()
         except TypeError:
             pass
-    text = str(value)
-    if text == "NoArchType(None)":
-        return "none"
-    return escape(text)
+    return _format_text_value(str(value))
+
+
+def _byte_unit_index(value: int) -> int:
+    # Each unit spans ten bits, so the bit length picks the unit directly.
+    return min(max(value.bit_length() - 1, 0) // 10, len(_BYTE_UNITS) - 1)
+
+
+@lru_cache(maxsize=4096)
+def _format_byte_size(value: int) -> str:
+    unit_index = _byte_unit_index(value)
+    if unit_index == 0:
+        return f"{value:,} B"
+    size = value / (1 << (10 * unit_index))
+    return f"{size:.1f} {_BYTE_UNITS[unit_index]} ({value:,} bytes)"
+
+
+@lru_cache(maxsize=4096)
+def _format_human_byte_size(value: int) -> str:
+    unit_index = _byte_unit_index(value)
+    if unit_index == 0:
+        return f"{value:,} B"
+    size = value / (1 << (10 * unit_index))
+    return f"{size:.1f} {_BYTE_UNITS[unit_index]}"
 
 
 def format_byte_size(value: Any) -> str:
@@ -130,19 +194,7 @@ def format_byte_size(value: Any) -> str:
         return "not available"
     if not isinstance(value, int) or value < 0:
         return format_record_value(value)
-
-    units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB"]
-    size = float(value)
-    unit = units[0]
-    for candidate in units:
-        unit = candidate
-        if size < 1024.0 or candidate == units[-1]:
-            break
-        size /= 1024.0
-
-    if unit == "B":
-        return f"{value:,} B"
-    return f"{size:.1f} {unit} ({value:,} bytes)"
+    return _format_byte_size(value)
 
 
 def format_human_byte_size(value: Any) -> str:
@@ -150,19 +202,7 @@ def format_human_byte_size(value: Any) -> str:
         return "not available"
     if not isinstance(value, int) or value < 0:
         return format_record_value(value)
-
-    units = ["B", "KiB", "MiB", "GiB", "TiB", "PiB"]
-    size = float(value)
-    unit = units[0]
-    for candidate in units:
-        unit = candidate
-        if size < 1024.0 or candidate == units[-1]:
-            break
-        size /= 1024.0
-
-    if unit == "B":
-        return f"{value:,} B"
-    return f"{size:.1f} {unit}"
+    return _format_human_byte_size(value)
 
 
 def render_package_preview(
@@ -172,7 +212,15 @@ def render_package_preview(
     record_sort_key: Callable[
         [RepoDataRecord], tuple[VersionWithSource, str, str, int]
     ],
+    presorted: bool = False,
 ) -> str:
+    """Render the version selector preview of a package.
+
+    Pass `presorted=True` when `records` are already sorted newest first by
+    `record_sort_key`, as returned by the repodata queries. Each subdir bucket
+    then keeps that order and no sort keys are computed. Rows that tie on the
+    sort key render identically, so the file name tie-break is not needed.
+    """
     if not records:
         return f"# {package_name}\n\nNo metadata records found."
 
@@ -180,42 +228,49 @@ def render_package_preview(
     for record in records:
         grouped_by_subdir[record.subdir].append(record)
 
-    for subdir_records in grouped_by_subdir.values():
-        subdir_records.sort(
-            key=lambda record: (
-                *record_sort_key(record),
-                record.file_name,
-            ),
-            reverse=True,
-        )
+    if not presorted:
+        for subdir_records in grouped_by_subdir.values():
+            subdir_records.sort(
+                key=lambda record: (*record_sort_key(record), record.file_name),
+                reverse=True,
+            )
 
     sorted_subdirs = sorted(
         grouped_by_subdir,
         key=lambda subdir: (subdir == "noarch", subdir),
     )
 
-    version_width = max(len(str(record.version)) for record in records)
-    build_width = max(len(record.build) for record in records)
+    # Each record's version is converted to text once; reading it through the
+    # binding builds a fresh `Version` object on every access.
+    rows_by_subdir: dict[str, list[tuple[str, str]]] = {
+        subdir: [(str(record.version), record.build) for record in subdir_records]
+        for subdir, subdir_records in grouped_by_subdir.items()
+    }
+    version_width = max(
+        len(version) for rows in rows_by_subdir.values() for version, _ in rows
+    )
+    build_width = max(
+        len(build) for rows in rows_by_subdir.values() for _, build in rows
+    )
 
     lines = [
-        f"# {escape(package_name)}",
+        f"# {_escape(package_name)}",
         "",
         f"Version selector preview ({len(records)} artifact{'s' if len(records) != 1 else ''}):",
         "Press Enter to open the version list.",
     ]
 
     for subdir in sorted_subdirs:
-        subdir_records = grouped_by_subdir[subdir]
+        rows = rows_by_subdir[subdir]
         lines.extend(
             [
                 "",
-                f"▾ {escape(subdir)} ({len(subdir_records)})",
+                f"▾ {_escape(subdir)} ({len(rows)})",
             ]
         )
-        for record in subdir_records:
+        for version, build in rows:
             lines.append(
-                f"{escape(str(record.version)):<{version_width}} "
-                f"{escape(record.build):<{build_width}}"
+                f"{_escape(version):<{version_width}} {_escape(build):<{build_width}}"
             )
 
     return "\n".join(lines)
@@ -233,7 +288,7 @@ def _format_run_exports_lines(run_exports: RunExportsJson | None) -> list[str]:
         ("strong_constrains", run_exports.strong_constrains),
     )
     for label, values in sections:
-        lines.extend(f"{label}: {escape(value)}" for value in values)
+        lines.extend(f"{label}: {_escape(value)}" for value in values)
     return lines
 
 
@@ -330,7 +385,7 @@ def _metadata_rows_for_record(
         metadata_rows.append(("Provenance", provenance_value))
     if rattler_build_version:
         metadata_rows.append(
-            ("Built with", f"rattler-build {escape(rattler_build_version)}")
+            ("Built with", f"rattler-build {_escape(rattler_build_version)}")
         )
     return tuple(metadata_rows)
 
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Iterable
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from pathlib import Path
 
-from rattler.exceptions import GatewayError
+from rattler.exceptions import GatewayError, ParsePlatformError
 from rattler.match_spec import MatchSpec
 from rattler.networking import Client
 from rattler.platform import Platform
 from rattler.repo_data import Gateway, RepoDataRecord, SourceConfig
 from rattler.version import VersionWithSource
 
-from pixi_browse.platform_utils import platform_sort_key
+from pixi_browse.platform_utils import (
+    ALL_PLATFORMS_SORTED,
+    PLATFORM_NAMES,
+    parse_platform,
+    platform_sort_key,
+)
+
+PLATFORM_PROBE_TTL_SECONDS = 24 * 60 * 60
+# Cached probes older than this are refreshed in the background.
+PLATFORM_PROBE_REFRESH_SECONDS = 12 * 60 * 60
 
 
 @dataclass(frozen=True)
@@ -20,6 +34,17 @@ class MatchSpecQueryResult:
     records_by_package: dict[str, list[RepoDataRecord]]
 
 
+@dataclass(frozen=True)
+class CachedPlatformProbe:
+    platforms: list[Platform]
+    timestamp: float
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Whether the probe is old enough to be refreshed in the background."""
+        return time.time() - self.timestamp >= PLATFORM_PROBE_REFRESH_SECONDS
+
+
 def create_gateway(*, client: Client | None = None) -> Gateway:
     return Gateway(
         default_config=SourceConfig(
@@ -31,16 +56,71 @@ def create_gateway(*, client: Client | None = None) -> Gateway:
     )
 
 
+def default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "pixi-browse"
+
+
+def platform_cache_path(cache_dir: Path, channel_name: str) -> Path:
+    # `hash()` is salted per process, so use a stable digest for the file name.
+    digest = hashlib.sha256(channel_name.encode("utf-8")).hexdigest()[:16]
+    return cache_dir / "platform_probe" / f"{digest}.json"
+
+
+def read_platform_cache(
+    cache_dir: Path, channel_name: str
+) -> CachedPlatformProbe | None:
+    """Return the cached platform probe of a channel, or None on a miss.
+
+    Expired, unreadable and foreign entries count as misses.
+    """
+    path = platform_cache_path(cache_dir, channel_name)
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data["channel"] != channel_name:
+            return None
+        timestamp = float(data["timestamp"])
+        if time.time() - timestamp >= PLATFORM_PROBE_TTL_SECONDS:
+            return None
+        return CachedPlatformProbe(
+            platforms=[parse_platform(name) for name in data["platforms"]],
+            timestamp=timestamp,
+        )
+    except (OSError, ValueError, KeyError, TypeError, ParsePlatformError):
+        return None
+
+
+def _write_cached_platforms(
+    path: Path, channel_name: str, platforms: list[Platform]
+) -> None:
+    payload = {
+        "channel": channel_name,
+        "timestamp": time.time(),
+        "platforms": [PLATFORM_NAMES[platform] for platform in platforms],
+    }
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path.write_text(json.dumps(payload), encoding="utf-8", newline="\n")
+        os.replace(temporary_path, path)
+    except OSError:
+        temporary_path.unlink(missing_ok=True)
+
+
 async def discover_available_platforms(
     *,
     gateway: Gateway,
     channel_name: str,
     max_parallel: int = 12,
+    cache_dir: Path | None = None,
+    refresh: bool = False,
 ) -> list[Platform]:
-    candidates = sorted(
-        Platform.all(),
-        key=platform_sort_key,
-    )
+    if cache_dir is not None and not refresh:
+        cached = read_platform_cache(cache_dir, channel_name)
+        if cached is not None:
+            return cached.platforms
+
     semaphore = asyncio.Semaphore(max_parallel)
 
     async def probe(platform: Platform) -> Platform | None:
@@ -55,11 +135,17 @@ async def discover_available_platforms(
 
         return platform if names else None
 
-    discovered = await asyncio.gather(*(probe(platform) for platform in candidates))
-    return sorted(
-        (platform for platform in discovered if platform is not None),
-        key=platform_sort_key,
+    # `gather` preserves the order of the already sorted candidates.
+    discovered = await asyncio.gather(
+        *(probe(platform) for platform in ALL_PLATFORMS_SORTED)
     )
+    available = [platform for platform in discovered if platform is not None]
+    # Never persist an empty probe: it is most likely a transient network issue.
+    if cache_dir is not None and available:
+        _write_cached_platforms(
+            platform_cache_path(cache_dir, channel_name), channel_name, available
+        )
+    return available
 
 
 async def fetch_package_names(
@@ -79,14 +165,23 @@ async def fetch_package_names(
     return platforms, sorted({name.normalized for name in names})
 
 
-def record_identity_key(record: RepoDataRecord) -> tuple[str, str, int, str, str]:
-    return (
-        str(record.version),
-        record.build,
-        record.build_number,
-        record.subdir,
-        record.file_name,
-    )
+def record_identity_key(record: RepoDataRecord) -> tuple[str, str]:
+    """Identify an artifact by its location within the channel.
+
+    The file name already encodes name, version and build string, so this
+    avoids materializing a `Version` object for every queried record.
+    """
+    return (record.subdir, record.file_name)
+
+
+def _unique_records(
+    by_source: Iterable[Iterable[RepoDataRecord]],
+) -> dict[tuple[str, str], RepoDataRecord]:
+    unique_records: dict[tuple[str, str], RepoDataRecord] = {}
+    for source_records in by_source:
+        for record in source_records:
+            unique_records[record_identity_key(record)] = record
+    return unique_records
 
 
 async def query_package_records(
@@ -99,24 +194,56 @@ async def query_package_records(
         [RepoDataRecord], tuple[VersionWithSource, str, str, int]
     ],
 ) -> list[RepoDataRecord]:
-    unique_records: dict[tuple[str, str, int, str, str], RepoDataRecord] = {}
     by_source = await gateway.query(
         sources=[channel_name],
         platforms=platforms,
         specs=[package_name],
         recursive=False,
     )
-    for source_records in by_source:
-        for record in source_records:
-            unique_records[record_identity_key(record)] = record
-
     return sorted(
-        unique_records.values(),
+        _unique_records(by_source).values(),
         key=record_sort_key,
         reverse=True,
     )
 
 
+async def query_many_packages(
+    *,
+    gateway: Gateway,
+    channel_name: str,
+    platforms: list[Platform],
+    package_names: Sequence[str],
+    record_sort_key: Callable[
+        [RepoDataRecord], tuple[VersionWithSource, str, str, int]
+    ],
+) -> dict[str, list[RepoDataRecord]]:
+    """Query several packages with a single gateway call.
+
+    The gateway fetches the shards for all specs concurrently, so this pays one
+    round of network latency instead of one per package. Every requested name
+    is present in the result, with an empty list when it has no records.
+    """
+    if not package_names:
+        return {}
+
+    by_source = await gateway.query(
+        sources=[channel_name],
+        platforms=platforms,
+        specs=list(package_names),
+        recursive=False,
+    )
+    grouped_records: dict[str, list[RepoDataRecord]] = {
+        package_name: [] for package_name in package_names
+    }
+    for record in _unique_records(by_source).values():
+        grouped_records.setdefault(record.name.normalized, []).append(record)
+
+    return {
+        package_name: sorted(records, key=record_sort_key, reverse=True)
+        for package_name, records in grouped_records.items()
+    }
+
+
 async def query_matchspec_records(
     *,
     gateway: Gateway,
@@ -127,19 +254,14 @@ async def query_matchspec_records(
         [RepoDataRecord], tuple[VersionWithSource, str, str, int]
     ],
 ) -> MatchSpecQueryResult:
-    unique_records: dict[tuple[str, str, int, str, str], RepoDataRecord] = {}
     by_source = await gateway.query(
         sources=[channel_name],
         platforms=platforms,
         specs=[matchspec],
         recursive=False,
     )
-    for source_records in by_source:
-        for record in source_records:
-            unique_records[record_identity_key(record)] = record
-
     grouped_records: dict[str, list[RepoDataRecord]] = {}
-    for record in unique_records.values():
+    for record in _unique_records(by_source).values():
         package_name = record.name.normalized
         grouped_records.setdefault(package_name, []).append(record)
 
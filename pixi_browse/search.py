@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import re
+from collections.abc import Iterator, Sequence
+from itertools import compress, count
 
-def fuzzy_score(query: str, candidate: str) -> int | None:
-    """Score a candidate using subsequence matching; higher scores are
-    better."""
-    query = query.casefold().strip()
-    candidate = candidate.casefold()
+
+def _prepare_query(query: str) -> str:
+    return query.casefold().strip()
+
+
+def _subsequence_pattern(query: str) -> re.Pattern[str]:
+    """Compile a regex matching any string containing `query` as a
+    subsequence.
+
+    Each character after the first is matched as `[^c]*c`, which takes its
+    first occurrence without backtracking. A lazy `.*?` between characters
+    picks the same occurrences but backtracks exponentially on candidates
+    that do not match.
+    """
+    first, rest = re.escape(query[0]), query[1:]
+    return re.compile(
+        first + "".join(f"[^{escaped}]*{escaped}" for escaped in map(re.escape, rest))
+    )
+
+
+def _score_prepared(query: str, candidate: str) -> int | None:
+    """Score an already casefolded candidate against a prepared query."""
     if not query:
         return 0
 
@@ -13,9 +33,10 @@ def fuzzy_score(query: str, candidate: str) -> int | None:
     gap_penalty = 0
     run_length = 0
     longest_run = 0
+    find = candidate.find
 
     for char in query:
-        index = candidate.find(char, cursor + 1)
+        index = find(char, cursor + 1)
         if index == -1:
             return None
         if cursor != -1:
@@ -24,9 +45,189 @@ def fuzzy_score(query: str, candidate: str) -> int | None:
             run_length += 1
         else:
             run_length = 1
-        longest_run = max(longest_run, run_length)
+        if run_length > longest_run:
+            longest_run = run_length
         cursor = index
 
     prefix_bonus = 120 if candidate.startswith(query) else 0
     length_penalty = len(candidate) - len(query)
     return prefix_bonus + (longest_run * 20) - (gap_penalty * 2) - length_penalty
+
+
+def fuzzy_score(query: str, candidate: str) -> int | None:
+    """Score a candidate using subsequence matching; higher scores are
+    better."""
+    return _score_prepared(_prepare_query(query), candidate.casefold())
+
+
+def _match_scores(prepared: str, folded: Sequence[str]) -> Iterator[tuple[int, int]]:
+    """Yield `(index, key)` for every casefolded candidate matching a
+    non-empty prepared query, where lower keys rank first."""
+    matches = list(map(_subsequence_pattern(prepared).search, folded))
+    # The lazy subsequence regex picks the same characters as the scorer's
+    # left-to-right scan, so a match spanning exactly the query is one
+    # contiguous run with no gaps, and a prefix match is one that also starts
+    # at zero. Both reduce to closed forms without running the scorer.
+    query_length = len(prepared)
+    contiguous_score_base = 21 * query_length
+    prefix_score_base = 120 + contiguous_score_base
+    for index, folded_candidate, match in compress(
+        zip(count(), folded, matches), matches
+    ):
+        # `compress` only passes on the candidates that matched.
+        assert match is not None
+        if folded_candidate.startswith(prepared):
+            yield index, len(folded_candidate) - prefix_score_base
+        elif match.end() - match.start() == query_length:
+            yield index, len(folded_candidate) - contiguous_score_base
+        else:
+            score = _score_prepared(prepared, folded_candidate)
+            assert score is not None
+            yield index, -score
+
+
+def _rank_folded(
+    prepared: str, candidates: Sequence[str], folded: Sequence[str]
+) -> list[str]:
+    """Rank `candidates` against a non-empty prepared query, given their
+    casefolded forms in `folded`."""
+    scored = [
+        (key, candidates[index]) for index, key in _match_scores(prepared, folded)
+    ]
+    scored.sort()
+    return [candidate for _, candidate in scored]
+
+
+def fuzzy_rank(query: str, candidates: Sequence[str]) -> list[str]:
+    """Return the candidates matching `query`, best score first.
+
+    Ties are broken alphabetically. The query is prepared once for the whole
+    batch, and candidates that cannot match are rejected by a compiled
+    subsequence regex before the scorer runs.
+    """
+    prepared = _prepare_query(query)
+    if not prepared:
+        return sorted(candidates)
+    return _rank_folded(prepared, candidates, list(map(str.casefold, candidates)))
+
+
+class IncrementalFuzzyRanker:
+    """Memoize `fuzzy_rank` results while a query is typed.
+
+    Every name matching a query also matches each of the query's prefixes, so
+    a query that extends an already ranked one only rescans that query's
+    matches instead of every candidate. Otherwise the scan starts from the
+    candidates containing every character of the query, looked up in a
+    per-character index.
+
+    Only the results for the current query and its prefixes, and the index
+    entries for its characters, are kept, so memory does not grow with the
+    number of queries typed. Everything is dropped as soon as a different
+    candidate list is passed in.
+    """
+
+    def __init__(self) -> None:
+        self._candidates: Sequence[str] | None = None
+        self._results: dict[str, list[str]] = {}
+        self._folded_candidates: list[str] | None = None
+        self._char_index: dict[str, set[int]] = {}
+        self._alphabetical: tuple[list[str], list[int]] | None = None
+
+    def clear(self) -> None:
+        self._candidates = None
+        self._results.clear()
+        self._folded_candidates = None
+        self._char_index.clear()
+        self._alphabetical = None
+
+    def _folded(self) -> list[str]:
+        if self._folded_candidates is None:
+            assert self._candidates is not None
+            self._folded_candidates = list(map(str.casefold, self._candidates))
+        return self._folded_candidates
+
+    def _indices_containing(self, char: str) -> set[int]:
+        # Built lazily per character: a query only ever touches a few of them.
+        indices = self._char_index.get(char)
+        if indices is None:
+            indices = {
+                index for index, folded in enumerate(self._folded()) if char in folded
+            }
+            self._char_index[char] = indices
+        return indices
+
+    def _alphabetical_order(self) -> tuple[list[str], list[int]]:
+        """Return the sorted candidates and each candidate's position in
+        them."""
+        if self._alphabetical is None:
+            assert self._candidates is not None
+            candidates = self._candidates
+            order = sorted(range(len(candidates)), key=candidates.__getitem__)
+            positions = [0] * len(order)
+            for position, index in enumerate(order):
+                positions[index] = position
+            self._alphabetical = (
+                [candidates[index] for index in order],
+                positions,
+            )
+        return self._alphabetical
+
+    def _rank_containing(self, prepared: str) -> list[str]:
+        """Rank the candidates containing every character of `prepared`.
+
+        This is necessary for a subsequence match, and unlike an n-gram index
+        it does not drop matches whose characters are not adjacent. The
+        casefolded names are reused from the index instead of folding every
+        candidate again.
+        """
+        assert self._candidates is not None
+        chars = set(prepared)
+        char_index = self._char_index
+        for char in char_index.keys() - chars:
+            del char_index[char]
+        index_sets = sorted(map(self._indices_containing, chars), key=len)
+        indices = sorted(set.intersection(*index_sets))
+        folded = self._folded()
+        # Ties break alphabetically, so each match packs its score and its
+        # candidate's alphabetical position into one int: sorting those
+        # avoids comparing names whenever scores tie, which for short
+        # queries is most of the sort.
+        by_position, positions = self._alphabetical_order()
+        total = len(by_position)
+        keys = [
+            key * total + positions[indices[index]]
+            for index, key in _match_scores(
+                prepared, [folded[index] for index in indices]
+            )
+        ]
+        keys.sort()
+        return [by_position[key % total] for key in keys]
+
+    def rank(self, query: str, candidates: Sequence[str]) -> list[str]:
+        if candidates is not self._candidates:
+            self.clear()
+            self._candidates = candidates
+
+        prepared = _prepare_query(query)
+        # Extending the query or deleting from its end only reuses prefixes.
+        results = {
+            ranked_query: ranked
+            for ranked_query, ranked in self._results.items()
+            if prepared.startswith(ranked_query)
+        }
+        self._results = results
+        cached = results.get(prepared)
+        if cached is None:
+            pool: Sequence[str] | None = None
+            for end in range(len(prepared) - 1, 0, -1):
+                pool = results.get(prepared[:end])
+                if pool is not None:
+                    break
+            if pool is not None:
+                cached = fuzzy_rank(prepared, pool)
+            elif prepared:
+                cached = self._rank_containing(prepared)
+            else:
+                cached = sorted(candidates)
+            results[prepared] = cached
+        return list(cached)
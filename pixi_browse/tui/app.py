@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import webbrowser
 from collections import defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Coroutine, Iterable
 from pathlib import Path
-from typing import Literal, cast
+from typing import Any, Literal, TypeVar, cast
 
 from rattler.exceptions import GatewayError
 from rattler.match_spec import MatchSpec
@@ -15,14 +16,18 @@ from rattler.package_streaming import (
 from rattler.package_streaming import fetch_raw_package_file_from_url
 from rattler.platform import Platform
 from rattler.repo_data import Gateway, RepoDataRecord
-from rattler.version import Version, VersionWithSource
+from rattler.version import VersionWithSource
 from rich.markup import escape
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
+from textual.content import Content
 from textual.events import Key, Paste, Resize
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import OptionList, Static
+from textual.widgets.option_list import Option
 
 from pixi_browse import __version__
 from pixi_browse.models import (
@@ -36,7 +41,7 @@ from pixi_browse.models import (
     VersionRow,
     ViewMode,
 )
-from pixi_browse.platform_utils import platform_sort_key
+from pixi_browse.platform_utils import PLATFORM_NAMES, platform_sort_key
 from pixi_browse.rendering import (
     build_version_compare_data,
     format_human_byte_size,
@@ -45,14 +50,18 @@ from pixi_browse.rendering import (
 from pixi_browse.repodata import (
     MatchSpecQueryResult,
     create_gateway,
+    default_cache_dir,
     discover_available_platforms,
     fetch_package_names,
+    query_many_packages,
     query_matchspec_records,
     query_package_records,
+    read_platform_cache,
+    record_identity_key,
 )
-from pixi_browse.search import fuzzy_score
+from pixi_browse.search import IncrementalFuzzyRanker
 
-from .state import AboutUrls, ChannelStateSnapshot
+from .state import AboutUrls, ChannelStateSnapshot, LruCache
 from .version_loader import VersionDataLoader
 from .widgets import (
     ACTIVE_SECTION_TITLE_STYLE,
@@ -71,11 +80,22 @@ from .widgets import (
 )
 
 _PREVIEW_MAX_BYTES = 256 * 1024
+_PACKAGE_PREFETCH_COUNT = 8
+# Packages above and below the highlighted one to prefetch while browsing.
+_PACKAGE_NEIGHBOR_PREFETCH_RADIUS = 3
+_DOWNLOAD_PROGRESS_INTERVAL_SECONDS = 0.25
+_PACKAGE_PREVIEW_DEBOUNCE_SECONDS = 0.15
+_FILTER_DEBOUNCE_SECONDS = 0.08
+
+_WidgetT = TypeVar("_WidgetT", bound=Widget)
+_T = TypeVar("_T")
 
 
 class CondaMetadataTui(App[None]):
     CSS_PATH = Path(__file__).resolve().parent.parent / "selection_list.tcss"
     ENABLE_COMMAND_PALETTE = False
+    # Bounds the per-package repodata and preview caches for long sessions.
+    PACKAGE_RECORDS_CACHE_SIZE = 256
     BINDINGS = [
         Binding("question_mark", "show_help", "Help", show=False),
         Binding("tab", "tab_key", show=False, priority=True),
@@ -104,25 +124,75 @@ class CondaMetadataTui(App[None]):
         self._client = Client.default_client(user_agent=f"pixi-browse/{__version__}")
 
         self._gateway: Gateway = create_gateway(client=self._client)
+        self._cache_dir = default_cache_dir()
         self._platforms: list[Platform] = []
         self._available_platform_names: list[Platform] = []
+        self._available_platform_set_cache: (
+            tuple[list[Platform], frozenset[Platform]] | None
+        ) = None
         self._selected_platform_names: set[Platform] = set(selected_platforms)
         self._draft_selected_platform_names: set[Platform] | None = None
-        self._package_records_cache: dict[str, list[RepoDataRecord]] = {}
+        self._selected_platforms_text_cache: tuple[set[Platform], str] | None = None
+        self._package_records_cache: LruCache[str, list[RepoDataRecord]] = LruCache(
+            self.PACKAGE_RECORDS_CACHE_SIZE
+        )
+        self._package_preview_cache: LruCache[
+            str, tuple[list[RepoDataRecord], Content]
+        ] = LruCache(self.PACKAGE_RECORDS_CACHE_SIZE)
+        self._record_index_cache: LruCache[
+            str,
+            tuple[list[RepoDataRecord], dict[tuple[str, str], RepoDataRecord]],
+        ] = LruCache(self.PACKAGE_RECORDS_CACHE_SIZE)
         self._channel_name = channel_name
         self._mode: ViewMode = "packages"
         self._search_query = ""
         self._channel_package_names: list[str] = []
         self._all_package_names: list[str] = []
         self._visible_package_names: list[str] = []
+        self._package_ranker = IncrementalFuzzyRanker()
+        self._package_preview_timer: Timer | None = None
+        # The highlighted package row whose neighbours are prefetched once the
+        # preview timer settles.
+        self._package_neighbor_prefetch_index: int | None = None
+        self._package_records_tasks: dict[str, asyncio.Task[list[RepoDataRecord]]] = {}
+        # Every task started for the records cache, including the batches
+        # behind prefetched names. They run outside Textual's workers, so
+        # they are cancelled here when the cache is cleared or the app exits.
+        self._package_records_pending: set[asyncio.Task[Any]] = set()
+        self._filter_timer: Timer | None = None
+        self._filter_pending = False
+        self._resize_refresh_pending = False
+        self._chrome_text_signatures: dict[
+            tuple[int, str], tuple[str | Text, object]
+        ] = {}
+        self._sidebar_title_cache: (
+            tuple[tuple[ViewMode, str | None, bool], Text] | None
+        ) = None
+        self._versions_footer_cache: tuple[tuple[bool, str | None], Text] | None = None
+        self._widget_cache: dict[str, Widget] = {}
+        self._package_option_cache: dict[str, Option] = {}
+        self._package_options_cache: tuple[list[str], list[Option]] | None = None
+        self._filter_signature: tuple[list[str], str, list[str]] | None = None
+        self._package_preview_query: str | None = None
         self._startup_matchspec = default_matchspec
         self._matchspec_query = ""
         self._matchspec_records_by_package: dict[str, list[RepoDataRecord]] = {}
         self._current_versions: list[VersionEntry] = []
         self._version_subdirs: list[str] = []
         self._versions_by_subdir: dict[str, list[VersionEntry]] = {}
-        self._collapsed_version_subdirs: set[str] = set()
+        self._version_label_cache: dict[
+            str, tuple[list[VersionEntry], int, list[str]]
+        ] = {}
+        self._version_label_parts_cache: dict[
+            str, tuple[list[VersionEntry], list[tuple[str, str]]]
+        ] = {}
+        self._version_option_cache: dict[str, tuple[list[str], list[Option]]] = {}
+        self._version_entry_rows_cache: dict[
+            str, tuple[list[VersionEntry], list[VersionRow]]
+        ] = {}
+        self._collapsed_version_subdirs: frozenset[str] = frozenset()
         self._version_rows: list[VersionRow] = []
+        self._version_section_row_index: dict[str, int] = {}
         self._version_loader = VersionDataLoader(client=self._client)
         self._version_about_urls_cache = self._version_loader.about_urls_cache
         self._version_paths_cache = self._version_loader.paths_cache
@@ -154,8 +224,29 @@ class CondaMetadataTui(App[None]):
             yield MainPanel(id="main-panel")
         yield Static(self._footer_text(), id="footer")
 
+    # The widgets below are looked up on nearly every key press and live for
+    # the whole session, so each is queried once and then reused.
+    def _cached_widget(self, selector: str, widget_type: type[_WidgetT]) -> _WidgetT:
+        widget = self._widget_cache.get(selector)
+        if widget is None:
+            widget = self.query_one(selector, widget_type)
+            self._widget_cache[selector] = widget
+        return cast(_WidgetT, widget)
+
+    def _sidebar_list(self) -> OptionList:
+        return self._cached_widget("#sidebar-list", OptionList)
+
+    def _main_panel(self) -> MainPanel:
+        return self._cached_widget("#main-panel", MainPanel)
+
+    def _status_widget(self) -> Static:
+        return self._cached_widget("#status", Static)
+
+    def _footer_widget(self) -> Static:
+        return self._cached_widget("#footer", Static)
+
     async def on_mount(self) -> None:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         package_list.disabled = True
         package_list.focus()
         self._update_filter_indicator()
@@ -163,11 +254,15 @@ class CondaMetadataTui(App[None]):
         if loaded and self._startup_matchspec is not None:
             await self._apply_matchspec_query(self._startup_matchspec)
 
+    def on_unmount(self) -> None:
+        self._cancel_package_records_tasks()
+
     async def _load_packages(self) -> bool:
-        status = self.query_one("#status", Static)
+        status = self._status_widget()
         status.update("Discovering available platforms via sharded gateway...")
         try:
-            await self._ensure_available_platforms()
+            if not self._can_fetch_names_during_discovery():
+                await self._ensure_available_platforms()
             status.update(
                 f"Downloading repodata for {self._selected_platforms_text()} (sharded)..."
             )
@@ -180,19 +275,47 @@ class CondaMetadataTui(App[None]):
         self._visible_package_names = list(self._all_package_names)
         self._render_package_options()
 
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         package_list.disabled = False
         package_list.focus()
         self._update_platform_indicator()
         self._update_package_selection_status()
         if self._visible_package_names:
             self._request_package_preview(self._visible_package_names[0])
+            self._request_package_records_prefetch(
+                self._visible_package_names[:_PACKAGE_PREFETCH_COUNT]
+            )
         return True
 
     async def _discover_available_platforms(self) -> list[Platform]:
+        cached = read_platform_cache(self._cache_dir, self._channel_name)
+        if cached is not None:
+            if cached.needs_refresh:
+                self._request_platform_probe_refresh(self._channel_name)
+            return cached.platforms
+        # The cache was just read and missed, so go straight to the probe.
         return await discover_available_platforms(
             gateway=self._gateway,
             channel_name=self._channel_name,
+            cache_dir=self._cache_dir,
+            refresh=True,
+        )
+
+    async def _refresh_platform_probe(self, channel_name: str) -> None:
+        # Only rewrites the on-disk cache so the next discovery finds it warm;
+        # the platforms already in use stay untouched.
+        await discover_available_platforms(
+            gateway=self._gateway,
+            channel_name=channel_name,
+            cache_dir=self._cache_dir,
+            refresh=True,
+        )
+
+    def _request_platform_probe_refresh(self, channel_name: str) -> None:
+        self.run_worker(
+            self._refresh_platform_probe(channel_name),
+            group="platform-probe-refresh",
+            exit_on_error=False,
         )
 
     async def _ensure_available_platforms(self) -> None:
@@ -201,67 +324,186 @@ class CondaMetadataTui(App[None]):
         if not self._available_platform_names:
             raise RuntimeError("No reachable platform repodata endpoints found.")
 
-        self._selected_platform_names = {
-            platform
-            for platform in self._selected_platform_names
-            if platform in self._available_platform_names
-        }
+        self._selected_platform_names = (
+            self._selected_platform_names & self._available_platform_set()
+        )
         if self._selected_platform_names:
             return
 
         self._selected_platform_names = set(self._available_platform_names)
 
+    def _available_platform_set(self) -> frozenset[Platform]:
+        # The available list is replaced rather than mutated, so its identity
+        # tells whether the set built from it is still current.
+        available = self._available_platform_names
+        cached = self._available_platform_set_cache
+        if cached is None or cached[0] is not available:
+            cached = (available, frozenset(available))
+            self._available_platform_set_cache = cached
+        return cached[1]
+
+    def _can_fetch_names_during_discovery(self) -> bool:
+        return not self._available_platform_names and bool(
+            self._selected_platform_names
+        )
+
+    async def _fetch_requested_package_names(
+        self, platforms: set[Platform]
+    ) -> tuple[list[Platform], list[str]] | None:
+        try:
+            return await fetch_package_names(
+                gateway=self._gateway,
+                channel_name=self._channel_name,
+                selected_platforms=platforms,
+            )
+        except GatewayError:
+            return None
+
     async def _fetch_package_names_with_gateway(self) -> list[str]:
-        await self._ensure_available_platforms()
+        fetched: tuple[list[Platform], list[str]] | None = None
+        if self._can_fetch_names_during_discovery():
+            # Explicitly requested platforms are almost always available, so
+            # their names are downloaded while the platform probe still runs
+            # and only refetched if discovery narrows the selection.
+            requested = set(self._selected_platform_names)
+            fetched, _ = await asyncio.gather(
+                self._fetch_requested_package_names(requested),
+                self._ensure_available_platforms(),
+            )
+            if self._selected_platform_names != requested:
+                fetched = None
+        else:
+            await self._ensure_available_platforms()
 
-        self._platforms, package_names = await fetch_package_names(
-            gateway=self._gateway,
-            channel_name=self._channel_name,
-            selected_platforms=self._selected_platform_names,
-        )
+        if fetched is None:
+            fetched = await fetch_package_names(
+                gateway=self._gateway,
+                channel_name=self._channel_name,
+                selected_platforms=self._selected_platform_names,
+            )
+        self._platforms, package_names = fetched
         return package_names
 
+    def _package_options(self, package_names: list[str]) -> list[Option]:
+        # One `Option` per package name is reused across renders: repopulating
+        # the list skips constructing them again, and each row keeps the visual
+        # it was rendered with.
+        cached = self._package_options_cache
+        if cached is not None and cached[0] is package_names:
+            return cached[1]
+        cache = self._package_option_cache
+        options: list[Option] = []
+        append = options.append
+        for package_name in package_names:
+            option = cache.get(package_name)
+            if option is None:
+                option = cache[package_name] = Option(package_name)
+            append(option)
+        self._package_options_cache = (package_names, options)
+        return options
+
     def _render_package_options(self, *, preserve_position: bool = False) -> None:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
+        if not self._visible_package_names:
+            package_list.clear_options()
+            package_list.add_option("No packages found")
+            return
+
+        options = self._package_options(self._visible_package_names)
+        if package_list.options == options:
+            # E.g. a query that only gained a trailing space ranks the same.
+            if not preserve_position:
+                package_list.action_first()
+            return
         previous_highlight = package_list.highlighted
         previous_scroll_y = package_list.scroll_y
         package_list.clear_options()
-        if self._visible_package_names:
-            package_list.add_options(self._visible_package_names)
-            if preserve_position and previous_highlight is not None:
-                package_list.highlighted = min(
-                    previous_highlight, len(self._visible_package_names) - 1
-                )
-                package_list.scroll_to(y=previous_scroll_y, animate=False)
-            else:
-                package_list.action_first()
-            return
-        package_list.add_option("No packages found")
+        package_list.add_options(options)
+        if preserve_position and previous_highlight is not None:
+            package_list.highlighted = min(
+                previous_highlight, len(self._visible_package_names) - 1
+            )
+            package_list.scroll_to(y=previous_scroll_y, animate=False)
+        else:
+            package_list.action_first()
 
     def _version_row_width(self) -> int:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         return max(16, package_list.size.width - 4)
 
-    def _format_version_option_label(self, entry: VersionEntry, row_width: int) -> str:
-        left = str(entry.version)
-        right = entry.build
+    @staticmethod
+    def _format_version_option_label(left: str, right: str, row_width: int) -> str:
         if row_width <= len(left) + len(right) + 1:
             return f"{left} {right}"
-        gap = row_width - len(left) - len(right)
-        return f"{left}{' ' * gap}{right}"
+        return left.ljust(row_width - len(right)) + right
+
+    def _version_label_parts(
+        self, subdir: str, entries: list[VersionEntry]
+    ) -> list[tuple[str, str]]:
+        # `str(entry.version)` crosses into rattler for every entry and is most
+        # of the label cost, so keep the texts across row width changes.
+        cached = self._version_label_parts_cache.get(subdir)
+        if cached is not None and cached[0] is entries:
+            return cached[1]
+        parts = [(str(entry.version), entry.build) for entry in entries]
+        self._version_label_parts_cache[subdir] = (entries, parts)
+        return parts
+
+    def _version_option_labels(
+        self, subdir: str, entries: list[VersionEntry], row_width: int
+    ) -> list[str]:
+        # Section toggles re-render the whole list; reuse the labels as long as
+        # the subdir's entries and the row width are unchanged.
+        cached = self._version_label_cache.get(subdir)
+        if cached is not None and cached[0] is entries and cached[1] == row_width:
+            return cached[2]
+        format_label = self._format_version_option_label
+        labels = [
+            format_label(left, right, row_width)
+            for left, right in self._version_label_parts(subdir, entries)
+        ]
+        self._version_label_cache[subdir] = (entries, row_width, labels)
+        return labels
+
+    def _version_options(
+        self, subdir: str, entries: list[VersionEntry], row_width: int
+    ) -> list[Option]:
+        # OptionList wraps every prompt string in a new Option, so keep the
+        # wrapped options for as long as their labels are reused.
+        labels = self._version_option_labels(subdir, entries, row_width)
+        cached = self._version_option_cache.get(subdir)
+        if cached is not None and cached[0] is labels:
+            return cached[1]
+        options = [Option(label) for label in labels]
+        self._version_option_cache[subdir] = (labels, options)
+        return options
+
+    def _version_entry_rows(
+        self, subdir: str, entries: list[VersionEntry]
+    ) -> list[VersionRow]:
+        cached = self._version_entry_rows_cache.get(subdir)
+        if cached is not None and cached[0] is entries:
+            return cached[1]
+        rows = [
+            VersionRow(kind="entry", subdir=subdir, entry=entry) for entry in entries
+        ]
+        self._version_entry_rows_cache[subdir] = (entries, rows)
+        return rows
 
     def _render_version_options(self, *, preserve_position: bool = False) -> None:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         previous_highlight = package_list.highlighted
         previous_scroll_y = package_list.scroll_y
         package_list.clear_options()
         self._version_rows = []
+        self._version_section_row_index = {}
 
-        package_list.add_option("< Back to packages")
+        prompts: list[str | Option] = ["< Back to packages"]
         self._version_rows.append(VersionRow(kind="back"))
         if not self._current_versions:
-            package_list.add_option("No versions found")
+            prompts.append("No versions found")
             self._version_rows.append(VersionRow(kind="empty"))
+            package_list.add_options(prompts)
             package_list.action_first()
             return
 
@@ -270,22 +512,18 @@ class CondaMetadataTui(App[None]):
             subdir_entries = self._versions_by_subdir.get(subdir, [])
             collapsed = subdir in self._collapsed_version_subdirs
             marker = "▸" if collapsed else "▾"
-            package_list.add_option(f"{marker} {subdir} ({len(subdir_entries)})")
+            prompts.append(f"{marker} {subdir} ({len(subdir_entries)})")
+            self._version_section_row_index[subdir] = len(self._version_rows)
             self._version_rows.append(VersionRow(kind="section", subdir=subdir))
             if collapsed:
                 continue
 
-            package_list.add_options(
-                [
-                    self._format_version_option_label(entry, row_width)
-                    for entry in subdir_entries
-                ]
-            )
-            self._version_rows.extend(
-                VersionRow(kind="entry", subdir=subdir, entry=entry)
-                for entry in subdir_entries
-            )
+            prompts.extend(self._version_options(subdir, subdir_entries, row_width))
+            self._version_rows.extend(self._version_entry_rows(subdir, subdir_entries))
 
+        # A single batch keeps this to one layout pass. Patching rows in place
+        # would be slower: OptionList re-indexes every later option per removal.
+        package_list.add_options(prompts)
         if preserve_position and previous_highlight is not None:
             package_list.highlighted = min(
                 previous_highlight, len(self._version_rows) - 1
@@ -294,19 +532,20 @@ class CondaMetadataTui(App[None]):
         else:
             package_list.action_first()
 
+    def _index_version_sections(self) -> None:
+        self._version_section_row_index = {
+            row.subdir: index
+            for index, row in enumerate(self._version_rows)
+            if row.kind == "section" and row.subdir is not None
+        }
+
     def _find_version_section_index(self, subdir: str) -> int | None:
-        for index, row in enumerate(self._version_rows):
-            if row.kind == "section" and row.subdir == subdir:
-                return index
-        return None
+        return self._version_section_row_index.get(subdir)
 
     def _toggle_version_section(self, subdir: str) -> None:
-        if subdir in self._collapsed_version_subdirs:
-            self._collapsed_version_subdirs.remove(subdir)
-        else:
-            self._collapsed_version_subdirs.add(subdir)
+        self._collapsed_version_subdirs ^= {subdir}
 
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         previous_scroll_y = package_list.scroll_y
         self._render_version_options()
         section_index = self._find_version_section_index(subdir)
@@ -315,7 +554,7 @@ class CondaMetadataTui(App[None]):
             package_list.scroll_to(y=previous_scroll_y, animate=False)
 
     def _update_versions_status(self) -> None:
-        self.query_one("#status", Static).update(
+        self._status_widget().update(
             f"{len(self._current_versions):,} entries across "
             f"{len(self._version_subdirs)} platform{'s' if len(self._version_subdirs) > 1 else ''}."
         )
@@ -326,7 +565,7 @@ class CondaMetadataTui(App[None]):
             draft = set(self._selected_platform_names)
             self._draft_selected_platform_names = draft
 
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         package_list.clear_options()
 
         if not self._available_platform_names:
@@ -336,14 +575,16 @@ class CondaMetadataTui(App[None]):
 
         package_list.add_options(
             [
-                f"✓ {str(platform)}" if platform in draft else f"  {str(platform)}"
+                f"✓ {PLATFORM_NAMES[platform]}"
+                if platform in draft
+                else f"  {PLATFORM_NAMES[platform]}"
                 for platform in self._available_platform_names
             ]
         )
         package_list.highlighted = 0
 
     def _render_sidebar_loading_option(self, label: str) -> None:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         package_list.clear_options()
         package_list.add_option(label)
         package_list.highlighted = 0
@@ -352,7 +593,7 @@ class CondaMetadataTui(App[None]):
         if self._mode != "packages":
             return
 
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         self._last_package_highlight = package_list.highlighted
         self._last_package_scroll_y = package_list.scroll_y
 
@@ -363,26 +604,39 @@ class CondaMetadataTui(App[None]):
         self._update_platform_indicator()
 
     def _clear_record_caches(self) -> None:
-        self._package_records_cache.clear()
+        self._package_records_cache = LruCache(self.PACKAGE_RECORDS_CACHE_SIZE)
+        self._cancel_package_records_tasks()
+        self._package_preview_cache.clear()
+        self._record_index_cache.clear()
+        self._package_option_cache.clear()
+        self._package_options_cache = None
         self._version_loader.clear_caches()
 
     def _clear_compare_state(self) -> None:
         self._compare_selection = None
         self._compare_screen_open = False
-        self.query_one("#footer", Static).update(self._footer_text())
+        self._update_footer()
 
     def _reset_preview_state(self) -> None:
         self._previewed_package = None
         self._pending_preview_package = None
+        self._package_preview_query = None
         self._previewed_version_key = None
         self._pending_preview_version_key = None
 
     def _clear_version_state(self) -> None:
-        self._current_versions.clear()
-        self._version_subdirs.clear()
-        self._versions_by_subdir.clear()
-        self._collapsed_version_subdirs.clear()
-        self._version_rows.clear()
+        # Containers referenced by a channel snapshot are replaced, never
+        # mutated, so snapshots can share them instead of copying.
+        self._current_versions = []
+        self._version_subdirs = []
+        self._versions_by_subdir = {}
+        self._version_label_cache.clear()
+        self._version_label_parts_cache.clear()
+        self._version_option_cache.clear()
+        self._version_entry_rows_cache.clear()
+        self._collapsed_version_subdirs = frozenset()
+        self._version_rows = []
+        self._version_section_row_index.clear()
         self._selected_package = None
 
     def _clear_channel_loaded_state(self) -> None:
@@ -396,6 +650,7 @@ class CondaMetadataTui(App[None]):
         self._channel_package_names = []
         self._all_package_names = []
         self._visible_package_names = []
+        self._package_ranker.clear()
         self._matchspec_query = ""
         self._matchspec_records_by_package = {}
         self._clear_record_caches()
@@ -430,7 +685,7 @@ class CondaMetadataTui(App[None]):
         await self._apply_matchspec_result(self._matchspec_query, result)
 
     def _snapshot_channel_state(self) -> ChannelStateSnapshot:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         return ChannelStateSnapshot(
             channel_name=self._channel_name,
             mode=self._mode,
@@ -439,40 +694,30 @@ class CondaMetadataTui(App[None]):
                 if self._draft_selected_platform_names is not None
                 else None
             ),
-            current_versions=list(self._current_versions),
-            version_subdirs=list(self._version_subdirs),
-            versions_by_subdir={
-                subdir: list(entries)
-                for subdir, entries in self._versions_by_subdir.items()
-            },
-            collapsed_version_subdirs=set(self._collapsed_version_subdirs),
-            version_rows=list(self._version_rows),
+            current_versions=self._current_versions,
+            version_subdirs=self._version_subdirs,
+            versions_by_subdir=self._versions_by_subdir,
+            collapsed_version_subdirs=self._collapsed_version_subdirs,
+            version_rows=self._version_rows,
             selected_package=self._selected_package,
             previewed_version_key=self._previewed_version_key,
             pending_preview_version_key=self._pending_preview_version_key,
             previewed_package=self._previewed_package,
             pending_preview_package=self._pending_preview_package,
-            platforms=list(self._platforms),
-            available_platform_names=list(self._available_platform_names),
-            selected_platform_names=set(self._selected_platform_names),
-            channel_package_names=list(self._channel_package_names),
-            all_package_names=list(self._all_package_names),
-            visible_package_names=list(self._visible_package_names),
+            platforms=self._platforms,
+            available_platform_names=self._available_platform_names,
+            selected_platform_names=self._selected_platform_names,
+            channel_package_names=self._channel_package_names,
+            all_package_names=self._all_package_names,
+            visible_package_names=self._visible_package_names,
             matchspec_query=self._matchspec_query,
-            matchspec_records_by_package={
-                package_name: list(records)
-                for package_name, records in self._matchspec_records_by_package.items()
-            },
-            package_records_cache={
-                package_name: list(records)
-                for package_name, records in self._package_records_cache.items()
-            },
-            version_about_urls_cache=dict(self._version_about_urls_cache),
-            version_paths_cache={
-                preview_key: list(paths)
-                for preview_key, paths in self._version_paths_cache.items()
-            },
-            version_artifact_data_cache=dict(self._version_artifact_data_cache),
+            matchspec_records_by_package=self._matchspec_records_by_package,
+            package_records_cache=self._package_records_cache,
+            # The version loader clears its caches in place, so only these
+            # are copied; their values are never mutated.
+            version_about_urls_cache=dict(self._version_about_urls_cache.items()),
+            version_paths_cache=dict(self._version_paths_cache.items()),
+            version_artifact_data_cache=dict(self._version_artifact_data_cache.items()),
             compare_selection=self._compare_selection,
             last_package_highlight=self._last_package_highlight,
             last_package_scroll_y=self._last_package_scroll_y,
@@ -489,6 +734,7 @@ class CondaMetadataTui(App[None]):
         self._versions_by_subdir = snapshot.versions_by_subdir
         self._collapsed_version_subdirs = snapshot.collapsed_version_subdirs
         self._version_rows = snapshot.version_rows
+        self._index_version_sections()
         self._selected_package = snapshot.selected_package
         self._previewed_version_key = snapshot.previewed_version_key
         self._pending_preview_version_key = snapshot.pending_preview_version_key
@@ -514,7 +760,7 @@ class CondaMetadataTui(App[None]):
         self._last_package_scroll_y = snapshot.last_package_scroll_y
 
     def _restore_ui_from_snapshot(self, snapshot: ChannelStateSnapshot) -> None:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         package_list.disabled = False
 
         if self._mode == "packages":
@@ -539,13 +785,9 @@ class CondaMetadataTui(App[None]):
         selected = set(
             self._draft_selected_platform_names or self._selected_platform_names
         )
-        selected = {
-            platform
-            for platform in selected
-            if platform in self._available_platform_names
-        }
+        selected &= self._available_platform_set()
         if not selected:
-            self.query_one("#status", Static).update(
+            self._status_widget().update(
                 "Select at least one platform before applying."
             )
             return
@@ -559,7 +801,7 @@ class CondaMetadataTui(App[None]):
         self._selected_platform_names = set(selected)
         self._draft_selected_platform_names = None
         self._update_platform_indicator()
-        self.query_one("#status", Static).update(
+        self._status_widget().update(
             f"Loading repodata for {self._selected_platforms_text()}..."
         )
 
@@ -578,13 +820,11 @@ class CondaMetadataTui(App[None]):
         except (GatewayError, RuntimeError) as exc:
             self._restore_channel_state(previous_state)
             self._restore_ui_from_snapshot(previous_state)
-            self.query_one("#status", Static).update(
-                f"Failed to load selected platforms: {exc!s}"
-            )
+            self._status_widget().update(f"Failed to load selected platforms: {exc!s}")
             return
 
         self._update_filter_indicator()
-        self.query_one("#sidebar-list", OptionList).focus()
+        self._sidebar_list().focus()
 
     async def _apply_channel_selection(self, channel_name: str) -> None:
         channel_name = channel_name.strip()
@@ -599,7 +839,7 @@ class CondaMetadataTui(App[None]):
         self._channel_name = channel_name
         self._clear_channel_loaded_state()
 
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         self._render_sidebar_loading_option("Loading packages...")
         package_list.disabled = True
         self._show_main_placeholder(f"# {escape(channel_name)}\n\nLoading repodata...")
@@ -630,9 +870,7 @@ class CondaMetadataTui(App[None]):
             self._draft_selected_platform_names = draft
 
         if platform in draft and len(draft) == 1:
-            self.query_one("#status", Static).update(
-                "At least one platform must remain selected."
-            )
+            self._status_widget().update("At least one platform must remain selected.")
             return
 
         if platform in draft:
@@ -641,13 +879,13 @@ class CondaMetadataTui(App[None]):
             draft.add(platform)
 
         self._render_platform_options()
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         package_list.highlighted = platform_index
         self._update_platform_indicator()
         self._update_platform_selection_status()
 
     def _update_package_selection_status(self) -> None:
-        self.query_one("#status", Static).update(
+        self._status_widget().update(
             f"{len(self._visible_package_names):,} packages in selection."
         )
 
@@ -661,16 +899,142 @@ class CondaMetadataTui(App[None]):
         if cached is not None:
             return cached
 
-        records = await query_package_records(
-            gateway=self._gateway,
-            channel_name=self._channel_name,
-            platforms=self._platforms,
-            package_name=package_name,
-            record_sort_key=self._record_sort_key,
-        )
-        self._package_records_cache[package_name] = records
+        task = self._package_records_tasks.get(package_name)
+        if task is None:
+            task = self._start_package_records_task(
+                self._fetch_package_records(package_name)
+            )
+            self._package_records_tasks[package_name] = task
+        # A superseded preview worker only stops waiting: the query keeps
+        # running and fills the cache for the next time the package is shown,
+        # and concurrent requests for the same package share it.
+        return await asyncio.shield(task)
+
+    def _start_package_records_task(
+        self, coroutine: Coroutine[Any, Any, _T]
+    ) -> asyncio.Task[_T]:
+        task = asyncio.create_task(coroutine)
+        pending = self._package_records_pending
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        # Nobody may be waiting any more when the query fails.
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        return task
+
+    def _cancel_package_records_tasks(self) -> None:
+        for task in self._package_records_pending:
+            task.cancel()
+        self._package_records_pending = set()
+        self._package_records_tasks = {}
+
+    async def _fetch_package_records(self, package_name: str) -> list[RepoDataRecord]:
+        channel_name = self._channel_name
+        platforms = list(self._platforms)
+        tasks = self._package_records_tasks
+        try:
+            records = await query_package_records(
+                gateway=self._gateway,
+                channel_name=channel_name,
+                platforms=platforms,
+                package_name=package_name,
+                record_sort_key=self._record_sort_key,
+            )
+        finally:
+            tasks.pop(package_name, None)
+        # The channel or platform selection may have changed while fetching.
+        if channel_name == self._channel_name and platforms == self._platforms:
+            self._package_records_cache[package_name] = records
         return records
 
+    def _missing_package_records(self, package_names: list[str]) -> list[str]:
+        return [
+            package_name
+            for package_name in package_names
+            if package_name not in self._package_records_cache
+            and package_name not in self._matchspec_records_by_package
+            and package_name not in self._package_records_tasks
+        ]
+
+    async def _prefetch_package_records(self, package_names: list[str]) -> None:
+        missing = self._missing_package_records(package_names)
+        if not missing:
+            return
+
+        batch = self._start_package_records_task(
+            self._fetch_many_package_records(missing)
+        )
+        # Register every name as in flight, so a preview or another prefetch
+        # of one of them waits for this batch instead of querying it again.
+        tasks = self._package_records_tasks
+        for package_name in missing:
+            tasks[package_name] = self._start_package_records_task(
+                self._package_records_from_batch(batch, package_name)
+            )
+        # Like a single query, the batch outlives a cancelled worker.
+        await asyncio.shield(batch)
+
+    async def _fetch_many_package_records(
+        self, package_names: list[str]
+    ) -> dict[str, list[RepoDataRecord]]:
+        channel_name = self._channel_name
+        platforms = list(self._platforms)
+        tasks = self._package_records_tasks
+        try:
+            records_by_package = await query_many_packages(
+                gateway=self._gateway,
+                channel_name=channel_name,
+                platforms=platforms,
+                package_names=package_names,
+                record_sort_key=self._record_sort_key,
+            )
+        finally:
+            for package_name in package_names:
+                tasks.pop(package_name, None)
+        # The channel or platform selection may have changed while fetching.
+        if channel_name == self._channel_name and platforms == self._platforms:
+            cache = self._package_records_cache
+            for package_name, records in records_by_package.items():
+                if package_name not in cache:
+                    cache[package_name] = records
+        return records_by_package
+
+    @staticmethod
+    async def _package_records_from_batch(
+        batch: asyncio.Task[dict[str, list[RepoDataRecord]]], package_name: str
+    ) -> list[RepoDataRecord]:
+        return (await batch)[package_name]
+
+    def _request_package_records_prefetch(
+        self,
+        package_names: list[str],
+        *,
+        group: str = "package-prefetch",
+    ) -> None:
+        self.run_worker(
+            self._prefetch_package_records(package_names),
+            group=group,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _request_package_neighbors_prefetch(self) -> None:
+        # Browsing moves one row at a time, so once the highlight settles,
+        # fetch the rows around it in one batch to make the next previews
+        # cache hits. This has its own group so that it never cancels the
+        # batch requested when the channel loaded.
+        option_index = self._package_neighbor_prefetch_index
+        self._package_neighbor_prefetch_index = None
+        if option_index is None:
+            return
+        start = max(0, option_index - _PACKAGE_NEIGHBOR_PREFETCH_RADIUS)
+        end = option_index + _PACKAGE_NEIGHBOR_PREFETCH_RADIUS + 1
+        neighbors = self._visible_package_names[start:end]
+        if not self._missing_package_records(neighbors):
+            return
+        self._request_package_records_prefetch(
+            neighbors, group="package-neighbor-prefetch"
+        )
+
     async def _get_current_package_records(
         self, package_name: str
     ) -> list[RepoDataRecord]:
@@ -679,47 +1043,47 @@ class CondaMetadataTui(App[None]):
             return matchspec_records
         return await self._get_package_records(package_name)
 
-    def _show_main_placeholder(self, content: str | Text) -> None:
-        self.query_one("#main-panel", MainPanel).show_placeholder(content)
+    def _show_main_placeholder(self, content: str | Text | Content) -> None:
+        self._main_panel().show_placeholder(content)
 
     def _show_version_details(self, details: VersionArtifactData) -> None:
-        self.query_one("#main-panel", MainPanel).show_version_details(details)
+        self._main_panel().show_version_details(details)
 
     def _set_active_main_section(self, index: int) -> None:
-        self.query_one("#main-panel", MainPanel).set_active_section(index)
+        self._main_panel().set_active_section(index)
 
     def _cycle_active_main_section(self, direction: int) -> None:
-        self.query_one("#main-panel", MainPanel).cycle_active_section(direction)
+        self._main_panel().cycle_active_section(direction)
 
     def _set_main_dependency_tab(self, tab: DependencyTab) -> None:
-        self.query_one("#main-panel", MainPanel).set_dependency_tab(tab)
+        self._main_panel().set_dependency_tab(tab)
 
     def _cycle_main_dependency_tab(self, direction: int) -> None:
-        self.query_one("#main-panel", MainPanel).cycle_dependency_tab(direction)
+        self._main_panel().cycle_dependency_tab(direction)
 
     def _selected_dependency_matchspec(self) -> str | None:
-        return self.query_one("#main-panel", MainPanel).selected_dependency_matchspec()
+        return self._main_panel().selected_dependency_matchspec()
 
     def _dependency_matchspec_at(self, index: int) -> str | None:
-        return self.query_one("#main-panel", MainPanel).dependency_matchspec_at(index)
+        return self._main_panel().dependency_matchspec_at(index)
 
     def _selected_file_path(self) -> str | None:
-        return self.query_one("#main-panel", MainPanel).selected_file_path()
+        return self._main_panel().selected_file_path()
 
     def _selected_file_size_in_bytes(self) -> int | None:
-        return self.query_one("#main-panel", MainPanel).selected_file_size_in_bytes()
+        return self._main_panel().selected_file_size_in_bytes()
 
     def _selected_file_sha256(self) -> bytes | None:
-        return self.query_one("#main-panel", MainPanel).selected_file_sha256()
+        return self._main_panel().selected_file_sha256()
 
     def _file_path_at(self, index: int) -> str | None:
-        return self.query_one("#main-panel", MainPanel).file_path_at(index)
+        return self._main_panel().file_path_at(index)
 
     def _file_size_at(self, index: int) -> int | None:
-        return self.query_one("#main-panel", MainPanel).file_size_at(index)
+        return self._main_panel().file_size_at(index)
 
     def _file_sha256_at(self, index: int) -> bytes | None:
-        return self.query_one("#main-panel", MainPanel).file_sha256_at(index)
+        return self._main_panel().file_sha256_at(index)
 
     def _open_matchspec_screen(
         self, initial_value: str, *, select_on_focus: bool = True
@@ -740,25 +1104,25 @@ class CondaMetadataTui(App[None]):
 
     def _focus_main_panel(self) -> None:
         self._selected_pane = "main"
-        self.query_one("#main-panel", MainPanel).focus()
+        self._main_panel().focus()
         self._update_filter_indicator()
 
     def _focus_sidebar(self) -> None:
         self._selected_pane = "sidebar"
-        self.query_one("#sidebar-list", OptionList).focus()
+        self._sidebar_list().focus()
         self._update_filter_indicator()
 
     def _sidebar_is_focused(self) -> bool:
-        return self.focused is self.query_one("#sidebar-list", OptionList)
+        return self.focused is self._sidebar_list()
 
     def _main_panel_is_focused(self) -> bool:
-        return self.focused is self.query_one("#main-panel", MainPanel)
+        return self.focused is self._main_panel()
 
     def _main_panel_shows_version_details(self) -> bool:
-        return self.query_one("#main-panel", MainPanel).showing_version_details()
+        return self._main_panel().showing_version_details()
 
     def _reset_main_panel_scroll(self) -> None:
-        self.query_one("#main-panel", MainPanel).reset_scroll()
+        self._main_panel().reset_scroll()
 
     def _sidebar_option_count(self) -> int:
         if self._mode == "packages":
@@ -773,7 +1137,7 @@ class CondaMetadataTui(App[None]):
         option_count = self._sidebar_option_count()
         if option_count <= 0:
             return
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         highlighted = max(0, min(index, option_count - 1))
         package_list.highlighted = highlighted
         self._update_main_panel_for_sidebar_highlight(highlighted)
@@ -782,7 +1146,7 @@ class CondaMetadataTui(App[None]):
         option_count = self._sidebar_option_count()
         if option_count <= 0:
             return
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         current = package_list.highlighted
         if current is None:
             current = 0
@@ -791,7 +1155,7 @@ class CondaMetadataTui(App[None]):
     def _page_sidebar(self, direction: int) -> None:
         page_size = max(
             1,
-            (self.query_one("#sidebar-list", OptionList).size.height - 2) // 2,
+            (self._sidebar_list().size.height - 2) // 2,
         )
         self._move_sidebar_highlight(direction * page_size)
 
@@ -850,21 +1214,34 @@ class CondaMetadataTui(App[None]):
     async def _get_record_for_version_entry(
         self, package_name: str, entry: VersionEntry
     ) -> RepoDataRecord | None:
-        for record in await self._get_current_package_records(package_name):
-            if (
-                record.version == entry.version
-                and record.build == entry.build
-                and record.build_number == entry.build_number
-                and record.subdir == entry.subdir
-                and record.file_name == entry.file_name
-            ):
-                return record
-        return None
+        records = await self._get_current_package_records(package_name)
+        # Records are unique per subdir and file name, so they are indexed by
+        # that once per records list instead of scanned for every lookup.
+        cached = self._record_index_cache.get(package_name)
+        if cached is not None and cached[0] is records:
+            records_by_key = cached[1]
+        else:
+            records_by_key = {record_identity_key(record): record for record in records}
+            self._record_index_cache[package_name] = (records, records_by_key)
+        record = records_by_key.get((entry.subdir, entry.file_name))
+        if (
+            record is None
+            or record.version != entry.version
+            or record.build != entry.build
+            or record.build_number != entry.build_number
+        ):
+            return None
+        return record
 
     async def _package_url_for_version_entry(
         self, package_name: str, entry: VersionEntry
     ) -> str:
         record = await self._get_record_for_version_entry(package_name, entry)
+        return self._package_url_for_record(record, entry)
+
+    def _package_url_for_record(
+        self, record: RepoDataRecord | None, entry: VersionEntry
+    ) -> str:
         if record is not None:
             return str(record.url)
 
@@ -1022,7 +1399,7 @@ class CondaMetadataTui(App[None]):
             right_artifact,
         )
         self._compare_screen_open = True
-        self.query_one("#footer", Static).update(self._footer_text())
+        self._update_footer()
         self.push_screen(
             CompareScreen(compare_data),
             self._handle_compare_screen_dismissed,
@@ -1096,11 +1473,19 @@ class CondaMetadataTui(App[None]):
 
         temporary_destination: Path | None = None
         try:
-            url = await self._package_url_for_version_entry(package_name, entry)
+            record = await self._get_record_for_version_entry(package_name, entry)
+            url = self._package_url_for_record(record, entry)
             destination = (Path.cwd() / entry.file_name).resolve()
             temporary_destination = destination.with_name(f"{destination.name}.part")
 
-            await package_download_to_path(self._client, url, temporary_destination)
+            await self._await_download_with_progress(
+                asyncio.ensure_future(
+                    package_download_to_path(self._client, url, temporary_destination)
+                ),
+                file_name=entry.file_name,
+                destination=temporary_destination,
+                total_size=record.size if record is not None else None,
+            )
             temporary_destination.replace(destination)
         except Exception as exc:
             if temporary_destination is not None:
@@ -1122,6 +1507,44 @@ class CondaMetadataTui(App[None]):
             title="Download",
         )
 
+    async def _await_download_with_progress(
+        self,
+        download: asyncio.Future[None],
+        *,
+        file_name: str,
+        destination: Path,
+        total_size: int | None,
+    ) -> None:
+        # rattler streams the archive straight to `destination`, so progress is
+        # read from the size of the partial file while the download runs.
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {download}, timeout=_DOWNLOAD_PROGRESS_INTERVAL_SECONDS
+                )
+                if done:
+                    download.result()
+                    return
+                try:
+                    written = destination.stat().st_size
+                except OSError:
+                    continue
+                self._set_download_indicator(
+                    self._download_progress_text(file_name, written, total_size)
+                )
+        finally:
+            download.cancel()
+
+    @staticmethod
+    def _download_progress_text(
+        file_name: str, written: int, total_size: int | None
+    ) -> str:
+        progress = format_human_byte_size(written)
+        if total_size:
+            percent = min(written * 100 // total_size, 100)
+            progress = f"{progress} / {format_human_byte_size(total_size)} ({percent}%)"
+        return f"Downloading {file_name}... {progress}"
+
     def _request_download_for_highlighted_entry(self) -> None:
         if self._mode != "versions":
             return
@@ -1357,9 +1780,12 @@ class CondaMetadataTui(App[None]):
             )
             destination.parent.mkdir(parents=True, exist_ok=True)
             temporary_destination = destination.with_name(f"{destination.name}.part")
-            temporary_destination.write_bytes(
-                await self._fetch_package_file_bytes(package_name, entry, file_path)
+            package_bytes = await self._fetch_package_file_bytes(
+                package_name, entry, file_path
             )
+            # Packaged files can be large shared libraries; keep the disk write
+            # off the event loop so the UI stays responsive.
+            await asyncio.to_thread(temporary_destination.write_bytes, package_bytes)
             temporary_destination.replace(destination)
         except Exception as exc:
             if temporary_destination is not None:
@@ -1666,12 +2092,23 @@ class CondaMetadataTui(App[None]):
 
     def _render_package_preview(
         self, package_name: str, records: list[RepoDataRecord]
-    ) -> str:
-        return render_package_preview(
-            package_name,
-            records,
-            record_sort_key=self._record_sort_key,
+    ) -> Content:
+        # Moving the highlight back and forth re-previews the same packages, so
+        # reuse the text as long as it was rendered from the same records list.
+        # It is cached already parsed so `Static.update` skips the markup pass.
+        cached = self._package_preview_cache.get(package_name)
+        if cached is not None and cached[0] is records:
+            return cached[1]
+        preview = Content.from_markup(
+            render_package_preview(
+                package_name,
+                records,
+                record_sort_key=self._record_sort_key,
+                presorted=True,
+            )
         )
+        self._package_preview_cache[package_name] = (records, preview)
+        return preview
 
     def _update_main_panel_for_package(
         self, package_name: str, records: list[RepoDataRecord]
@@ -1702,6 +2139,18 @@ class CondaMetadataTui(App[None]):
             return
 
         self._show_main_placeholder(f"# {package_name}\n\nLoading repodata...")
+        if self._package_preview_timer is not None:
+            # A query started moments ago, e.g. while an arrow key is held down.
+            # Wait for the highlight to settle instead of starting another one.
+            self._package_preview_timer.reset()
+            return
+        self._start_package_preview_query(package_name)
+        self._package_preview_timer = self.set_timer(
+            _PACKAGE_PREVIEW_DEBOUNCE_SECONDS, self._settle_package_preview
+        )
+
+    def _start_package_preview_query(self, package_name: str) -> None:
+        self._package_preview_query = package_name
         self.run_worker(
             self._load_and_render_package_preview(package_name),
             group="package-preview",
@@ -1709,20 +2158,58 @@ class CondaMetadataTui(App[None]):
             exit_on_error=False,
         )
 
+    def _settle_package_preview(self) -> None:
+        self._package_preview_timer = None
+        self._request_package_neighbors_prefetch()
+        package_name = self._pending_preview_package
+        if (
+            package_name is None
+            or package_name == self._previewed_package
+            or package_name == self._package_preview_query
+        ):
+            return
+        self._request_package_preview(package_name)
+
+    def _queue_filter(self) -> None:
+        """Filter for a typed character, coalescing bursts of keystrokes.
+
+        The first keystroke filters right away; keystrokes arriving while the
+        timer runs only mark the filter as pending and are applied in one scan
+        once typing pauses.
+        """
+        if self._filter_timer is not None:
+            self._filter_pending = True
+            self._filter_timer.reset()
+            return
+        self._filter_packages()
+        self._filter_timer = self.set_timer(
+            _FILTER_DEBOUNCE_SECONDS, self._settle_filter
+        )
+
+    def _settle_filter(self) -> None:
+        self._filter_timer = None
+        if self._filter_pending:
+            self._filter_packages()
+
     def _filter_packages(self) -> None:
-        if not self._filter_mode or not self._search_query:
-            self._visible_package_names = list(self._all_package_names)
+        self._filter_pending = False
+        query = self._search_query if self._filter_mode else ""
+        signature = self._filter_signature
+        if (
+            signature is not None
+            and signature[0] is self._all_package_names
+            and signature[1] == query
+        ):
+            # E.g. entering or leaving filter mode without a query: the names
+            # and their order are the same as last time.
+            self._visible_package_names = signature[2]
         else:
-            scored_results: list[tuple[int, str]] = []
-            for package_name in self._all_package_names:
-                score = fuzzy_score(self._search_query, package_name)
-                if score is not None:
-                    scored_results.append((score, package_name))
-
-            scored_results.sort(key=lambda item: (-item[0], item[1]))
-            self._visible_package_names = [
-                package_name for _, package_name in scored_results
-            ]
+            if query:
+                visible = self._package_ranker.rank(query, self._all_package_names)
+            else:
+                visible = list(self._all_package_names)
+            self._filter_signature = (self._all_package_names, query, visible)
+            self._visible_package_names = visible
         self._render_package_options()
         self._update_package_selection_status()
         self._previewed_package = None
@@ -1769,7 +2256,7 @@ class CondaMetadataTui(App[None]):
         query = str(matchspec)
 
         previous_state = self._snapshot_channel_state()
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         package_list.disabled = True
         self._render_sidebar_loading_option("Querying MatchSpec...")
         self._show_main_placeholder(
@@ -1799,7 +2286,7 @@ class CondaMetadataTui(App[None]):
         self._pending_preview_version_key = None
         self._filter_packages()
         self._update_filter_indicator()
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         if self._visible_package_names and self._last_package_highlight is not None:
             package_list.highlighted = min(
                 self._last_package_highlight, len(self._visible_package_names) - 1
@@ -1811,7 +2298,7 @@ class CondaMetadataTui(App[None]):
         self._focus_sidebar()
 
     async def _open_versions(self, package_name: str) -> None:
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         self._last_package_highlight = package_list.highlighted
         self._last_package_scroll_y = package_list.scroll_y
 
@@ -1819,17 +2306,22 @@ class CondaMetadataTui(App[None]):
         self._current_versions = self._build_version_entries(
             await self._get_current_package_records(package_name)
         )
+        # Entries are ordered by version first, so subdirs interleave and a
+        # `groupby` pass would not see them contiguously.
         grouped_versions: dict[str, list[VersionEntry]] = defaultdict(list)
         for entry in self._current_versions:
             grouped_versions[entry.subdir].append(entry)
-        self._version_subdirs = sorted(
-            grouped_versions,
-            key=lambda subdir: (subdir == "noarch", subdir),
+        # Platform subdirs alphabetically, with noarch last.
+        version_subdirs = sorted(
+            subdir for subdir in grouped_versions if subdir != "noarch"
         )
+        if "noarch" in grouped_versions:
+            version_subdirs.append("noarch")
+        self._version_subdirs = version_subdirs
         self._versions_by_subdir = {
             subdir: grouped_versions[subdir] for subdir in self._version_subdirs
         }
-        self._collapsed_version_subdirs.clear()
+        self._collapsed_version_subdirs = frozenset()
         self._mode = "versions"
         self._update_filter_indicator()
         self._render_version_options()
@@ -1842,23 +2334,24 @@ class CondaMetadataTui(App[None]):
     def _build_version_entries(
         self, records: list[RepoDataRecord]
     ) -> list[VersionEntry]:
-        versions_by_key: dict[tuple[Version, str, int, str, str], VersionEntry] = {}
+        # Every record attribute read crosses into rattler, and `version` builds
+        # a new object each time, so each one is read exactly once. The subdir
+        # and file name already identify the artifact.
+        versions_by_key: dict[tuple[str, str], VersionEntry] = {}
         for record in records:
-            key = (
-                record.version,
-                record.build,
-                record.build_number,
-                record.subdir,
-                record.file_name,
-            )
-            versions_by_key[key] = VersionEntry(
+            subdir = record.subdir
+            file_name = record.file_name
+            versions_by_key[(subdir, file_name)] = VersionEntry(
                 version=record.version,
                 build=record.build,
                 build_number=record.build_number,
-                subdir=record.subdir,
-                file_name=record.file_name,
+                subdir=subdir,
+                file_name=file_name,
             )
 
+        # Records usually arrive in this order already, which keeps the sort
+        # to a single linear pass. `sorted` computes each key once; the cost
+        # left is comparing `Version` objects, which stays in rattler.
         return sorted(
             versions_by_key.values(),
             key=lambda entry: (
@@ -1884,6 +2377,13 @@ class CondaMetadataTui(App[None]):
             )
 
         if self._mode == "versions":
+            key = (
+                self._compare_selection is not None,
+                self._download_indicator_override,
+            )
+            cached = self._versions_footer_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
             footer = Text("Search: / | Platform: p | Channel: c | MatchSpec: m")
             footer.append(" | ")
             compare_start = len(footer)
@@ -1893,11 +2393,16 @@ class CondaMetadataTui(App[None]):
             footer.append(" | ")
             footer.append_text(self._download_indicator_text())
             footer.append(" | Help: ?")
+            self._versions_footer_cache = (key, footer)
             return footer
 
         return "Search: / | Platform: p | Channel: c | MatchSpec: m | Help: ?"
 
     def _sidebar_title_text(self, *, selected: bool) -> Text:
+        key = (self._mode, self._selected_package, selected)
+        cached = self._sidebar_title_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         if self._mode == "versions":
             label = (
                 f"Versions: {self._selected_package}"
@@ -1908,12 +2413,14 @@ class CondaMetadataTui(App[None]):
             label = "Platforms"
         else:
             label = "Packages"
-        return Text(
+        title = Text(
             f"[0] {label}",
             style=ACTIVE_SECTION_TITLE_STYLE
             if selected
             else INACTIVE_SECTION_TITLE_STYLE,
         )
+        self._sidebar_title_cache = (key, title)
+        return title
 
     def _download_indicator_text(self) -> Text:
         if self._download_indicator_override is not None:
@@ -1923,35 +2430,72 @@ class CondaMetadataTui(App[None]):
 
     def _set_download_indicator(self, value: str | None) -> None:
         self._download_indicator_override = value
-        self.query_one("#footer", Static).update(self._footer_text())
+        self._update_footer()
         if self._mode == "versions":
             self._update_versions_status()
             return
         self._update_download_indicator()
 
+    def _update_footer(self) -> None:
+        footer = self._footer_widget()
+        text = self._footer_text()
+        if self._chrome_text_changed(footer, "footer", text):
+            footer.update(text)
+
+    def _set_border_text(
+        self,
+        widget: Widget,
+        attribute: Literal["border_title", "border_subtitle"],
+        text: str | Text,
+    ) -> None:
+        if self._chrome_text_changed(widget, attribute, text):
+            setattr(widget, attribute, text)
+
+    def _chrome_text_changed(self, widget: object, slot: str, text: str | Text) -> bool:
+        # Textual repaints a widget on every footer or border assignment, even
+        # of an equal value, and these are reassigned on nearly every key press.
+        # Rich `Text` equality ignores the base style, so compare it explicitly.
+        # Memoized texts are never mutated, so the same object is unchanged.
+        key = (id(widget), slot)
+        previous = self._chrome_text_signatures.get(key)
+        if previous is not None and previous[0] is text:
+            return False
+        signature: object = (
+            (text.plain, text.style, tuple(text.spans))
+            if isinstance(text, Text)
+            else text
+        )
+        self._chrome_text_signatures[key] = (text, signature)
+        return previous is None or previous[1] != signature
+
     def _update_download_indicator(self) -> None:
-        main_panel = self.query_one("#main-panel", MainPanel)
+        main_panel = self._main_panel()
         main_panel.styles.border_title_align = "left"
-        main_panel.border_title = ""
+        self._set_border_text(main_panel, "border_title", "")
         main_panel.styles.border_subtitle_align = "right"
-        main_panel.border_subtitle = ""
+        self._set_border_text(main_panel, "border_subtitle", "")
 
     def _selected_platforms_text(self) -> str:
-        return ", ".join(
-            str(platform)
-            for platform in sorted(
-                self._selected_platform_names,
-                key=platform_sort_key,
-            )
+        # The selection set is replaced, never mutated, whenever it changes.
+        selected = self._selected_platform_names
+        cached = self._selected_platforms_text_cache
+        if cached is not None and cached[0] is selected:
+            return cached[1]
+        text = ", ".join(
+            PLATFORM_NAMES[platform]
+            for platform in sorted(selected, key=platform_sort_key)
         )
+        self._selected_platforms_text_cache = (selected, text)
+        return text
 
     def _update_platform_selection_status(self) -> None:
+        # Only read here, so there is no need to copy either set.
         selected = (
-            set(self._draft_selected_platform_names)
+            self._draft_selected_platform_names
             if self._draft_selected_platform_names is not None
-            else set(self._selected_platform_names)
+            else self._selected_platform_names
         )
-        all_platforms = set(self._available_platform_names)
+        all_platforms = self._available_platform_set()
         selected_count = len(selected)
 
         message = Text()
@@ -1963,19 +2507,23 @@ class CondaMetadataTui(App[None]):
         else:
             message.append("All platforms: a")
 
-        self.query_one("#status", Static).update(message)
+        self._status_widget().update(message)
 
     def _update_filter_indicator(self) -> None:
-        sidebar = self.query_one("#sidebar", Vertical)
+        sidebar = self._cached_widget("#sidebar", Vertical)
         sidebar_selected = self._selected_pane == "sidebar"
         sidebar.set_class(sidebar_selected, "-active-pane")
-        sidebar.border_title = self._sidebar_title_text(selected=sidebar_selected)
-        sidebar.border_subtitle = ""
-        main_panel = self.query_one("#main-panel", MainPanel)
+        self._set_border_text(
+            sidebar,
+            "border_title",
+            self._sidebar_title_text(selected=sidebar_selected),
+        )
+        self._set_border_text(sidebar, "border_subtitle", "")
+        main_panel = self._main_panel()
         main_selected = self._selected_pane == "main"
         main_panel.set_class(main_selected, "-active-pane")
         main_panel.set_pane_selected(main_selected)
-        self.query_one("#footer", Static).update(self._footer_text())
+        self._update_footer()
         self._update_download_indicator()
 
     def _update_platform_indicator(self) -> None:
@@ -1991,7 +2539,7 @@ class CondaMetadataTui(App[None]):
 
     def _append_filter_char(self, char: str) -> None:
         self._search_query += char
-        self._filter_packages()
+        self._queue_filter()
         self._update_filter_indicator()
 
     def _set_channel_edit_mode(self, enabled: bool, *, reset_draft: bool) -> None:
@@ -2074,7 +2622,7 @@ class CondaMetadataTui(App[None]):
 
         if self._compare_selection is None:
             self._compare_selection = selection
-            self.query_one("#footer", Static).update(self._footer_text())
+            self._update_footer()
             self.notify(
                 f"Stored {self._compare_selection_label(selection)} as compare A.",
                 title="Compare",
@@ -2280,56 +2828,32 @@ class CondaMetadataTui(App[None]):
 
         self._reset_sidebar_vim_pending()
 
-        if (
-            self._mode == "versions"
-            and self._main_panel_shows_version_details()
-            and self._main_panel_is_focused()
-            and event.key == "enter"
-        ):
-            main_panel = self.query_one("#main-panel", MainPanel)
-            if main_panel.dependency_section_is_active():
-                matchspec = self._selected_dependency_matchspec()
-                if matchspec is not None:
-                    self._defer_matchspec_screen(matchspec)
+        if self._mode == "versions" and event.key in {
+            "enter",
+            "tab",
+            "shift+tab",
+            "backtab",
+        }:
+            # Look the panel state up once for all of the keys it decides.
+            if (
+                self._main_panel_shows_version_details()
+                and self._main_panel_is_focused()
+            ):
+                if event.key == "enter":
+                    main_panel = self._main_panel()
+                    if main_panel.dependency_section_is_active():
+                        matchspec = self._selected_dependency_matchspec()
+                        if matchspec is not None:
+                            self._defer_matchspec_screen(matchspec)
+                    elif main_panel.file_section_is_active():
+                        self._request_file_action_for_selected_file()
+                else:
+                    self._cycle_active_main_section(1 if event.key == "tab" else -1)
                 event.stop()
                 return
-            if main_panel.file_section_is_active():
-                self._request_file_action_for_selected_file()
+            if event.key != "enter":
                 event.stop()
                 return
-            event.stop()
-            return
-
-        if (
-            self._mode == "versions"
-            and self._main_panel_shows_version_details()
-            and self._main_panel_is_focused()
-            and event.key == "tab"
-        ):
-            self._cycle_active_main_section(1)
-            event.stop()
-            return
-
-        if (
-            self._mode == "versions"
-            and self._main_panel_shows_version_details()
-            and self._main_panel_is_focused()
-            and event.key in {"shift+tab", "backtab"}
-        ):
-            self._cycle_active_main_section(-1)
-            event.stop()
-            return
-
-        if (
-            self._mode == "versions"
-            and (
-                not self._main_panel_shows_version_details()
-                or not self._main_panel_is_focused()
-            )
-            and event.key in {"tab", "shift+tab", "backtab"}
-        ):
-            event.stop()
-            return
 
         if (
             self._mode == "versions"
@@ -2355,7 +2879,7 @@ class CondaMetadataTui(App[None]):
             self._mode == "versions"
             and event.character == "["
             and self._selected_pane == "main"
-            and self.query_one("#main-panel", MainPanel).dependency_section_is_active()
+            and self._main_panel().dependency_section_is_active()
         ):
             self._cycle_main_dependency_tab(-1)
             self._focus_main_panel()
@@ -2366,7 +2890,7 @@ class CondaMetadataTui(App[None]):
             self._mode == "versions"
             and event.character == "]"
             and self._selected_pane == "main"
-            and self.query_one("#main-panel", MainPanel).dependency_section_is_active()
+            and self._main_panel().dependency_section_is_active()
         ):
             self._cycle_main_dependency_tab(1)
             self._focus_main_panel()
@@ -2376,18 +2900,18 @@ class CondaMetadataTui(App[None]):
         if self._mode == "platforms" and event.key == "a":
             if not self._available_platform_names:
                 return
-            all_platforms = set(self._available_platform_names)
+            all_platforms = self._available_platform_set()
             draft = self._draft_selected_platform_names
             if draft is None:
                 draft = set(self._selected_platform_names)
 
             if draft != all_platforms:
                 self._draft_selected_platform_names = set(all_platforms)
-                package_list = self.query_one("#sidebar-list", OptionList)
+                package_list = self._sidebar_list()
                 highlighted = package_list.highlighted
                 self._render_platform_options()
                 if highlighted is not None:
-                    self.query_one("#sidebar-list", OptionList).highlighted = min(
+                    self._sidebar_list().highlighted = min(
                         highlighted, len(self._available_platform_names) - 1
                     )
                 self._update_platform_indicator()
@@ -2396,7 +2920,7 @@ class CondaMetadataTui(App[None]):
             return
 
         if self._mode == "platforms" and event.key == "space":
-            package_list = self.query_one("#sidebar-list", OptionList)
+            package_list = self._sidebar_list()
             highlighted = package_list.highlighted
             if highlighted is None:
                 return
@@ -2412,26 +2936,33 @@ class CondaMetadataTui(App[None]):
         if not self._filter_mode or self._mode != "packages":
             return
 
+        if event.key == "enter":
+            # The list binding selects the highlighted row next; bring the list
+            # up to date if a burst of keystrokes is still waiting to filter.
+            if self._filter_pending:
+                self._filter_packages()
+            return
+
         if event.key in {"p", "c", "C", "slash", "q"}:
             return
 
         if event.key == "backspace":
             self._search_query = self._search_query[:-1]
-            self._filter_packages()
+            self._queue_filter()
             self._update_filter_indicator()
             event.stop()
             return
 
         if event.key == "space":
             self._search_query += " "
-            self._filter_packages()
+            self._queue_filter()
             self._update_filter_indicator()
             event.stop()
             return
 
         if event.character and event.character.isprintable():
             self._search_query += event.character
-            self._filter_packages()
+            self._queue_filter()
             self._update_filter_indicator()
             event.stop()
 
@@ -2447,11 +2978,17 @@ class CondaMetadataTui(App[None]):
     def on_resize(self, event: Resize) -> None:
         del event
         self._update_filter_indicator()
+        # Dragging a terminal edge sends a burst of resizes; re-render the
+        # sidebar once after the next refresh rather than once per event.
+        if self._resize_refresh_pending:
+            return
+        self._resize_refresh_pending = True
         self.call_after_refresh(self._refresh_after_resize)
 
     def _refresh_after_resize(self) -> None:
+        self._resize_refresh_pending = False
         self._update_filter_indicator()
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         if self._mode == "packages":
             self._render_package_options(preserve_position=True)
         elif self._mode == "versions":
@@ -2473,7 +3010,7 @@ class CondaMetadataTui(App[None]):
         if self._mode != "versions":
             return None
 
-        package_list = self.query_one("#sidebar-list", OptionList)
+        package_list = self._sidebar_list()
         highlighted = package_list.highlighted
         if (
             highlighted is None
@@ -2511,7 +3048,16 @@ class CondaMetadataTui(App[None]):
         if self._mode == "packages":
             if option_index < 0 or option_index >= len(self._visible_package_names):
                 return
+            self._package_neighbor_prefetch_index = option_index
             self._request_package_preview(self._visible_package_names[option_index])
+            # Cached previews leave the timer alone, so (re)arm it here: the
+            # neighbours are prefetched once the highlight settles.
+            if self._package_preview_timer is None:
+                self._package_preview_timer = self.set_timer(
+                    _PACKAGE_PREVIEW_DEBOUNCE_SECONDS, self._settle_package_preview
+                )
+            else:
+                self._package_preview_timer.reset()
             return
 
         if self._mode != "versions":
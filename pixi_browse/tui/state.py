@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from collections.abc import ItemsView, Mapping
 from dataclasses import dataclass
 
 from rattler.platform import Platform
@@ -16,6 +18,49 @@ from pixi_browse.models import (
 )
 
 
+class LruCache[K, V]:
+    """A cache that evicts its least recently used entries beyond `maxsize`.
+
+    Only `get` and assignment count as a use; membership tests and `items`
+    leave the order alone.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        if key not in self._entries:
+            return default
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def items(self) -> ItemsView[K, V]:
+        return self._entries.items()
+
+    def update(self, entries: Mapping[K, V]) -> None:
+        for key, value in entries.items():
+            self[key] = value
+
+
 @dataclass(frozen=True)
 class AboutUrls:
     repository: tuple[str, ...] = ()
@@ -35,7 +80,7 @@ class ChannelStateSnapshot:
     current_versions: list[VersionEntry]
     version_subdirs: list[str]
     versions_by_subdir: dict[str, list[VersionEntry]]
-    collapsed_version_subdirs: set[str]
+    collapsed_version_subdirs: frozenset[str]
     version_rows: list[VersionRow]
     selected_package: str | None
     previewed_version_key: VersionPreviewKey | None
@@ -50,7 +95,7 @@ class ChannelStateSnapshot:
     visible_package_names: list[str]
     matchspec_query: str
     matchspec_records_by_package: dict[str, list[RepoDataRecord]]
-    package_records_cache: dict[str, list[RepoDataRecord]]
+    package_records_cache: LruCache[str, list[RepoDataRecord]]
     version_about_urls_cache: dict[VersionPreviewKey, AboutUrls]
     version_paths_cache: dict[VersionPreviewKey, list[PackageFile]]
     version_artifact_data_cache: dict[VersionPreviewKey, VersionArtifactData]
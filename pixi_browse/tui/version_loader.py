@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import yaml
+import asyncio
+
 from rattler.networking import Client
 from rattler.package import AboutJson, PathsJson, PathType, RunExportsJson
 from rattler.package_streaming import fetch_raw_package_file_from_url
@@ -14,15 +15,24 @@ from pixi_browse.models import (
 )
 from pixi_browse.rendering import build_version_artifact_data
 
-from .state import AboutUrls
+from .state import AboutUrls, LruCache
 
 
 class VersionDataLoader:
+    # Bounds each per-artifact cache for long sessions.
+    CACHE_SIZE = 2048
+
     def __init__(self, *, client: Client) -> None:
         self._client = client
-        self.about_urls_cache: dict[VersionPreviewKey, AboutUrls] = {}
-        self.paths_cache: dict[VersionPreviewKey, list[PackageFile]] = {}
-        self.artifact_data_cache: dict[VersionPreviewKey, VersionArtifactData] = {}
+        self.about_urls_cache: LruCache[VersionPreviewKey, AboutUrls] = LruCache(
+            self.CACHE_SIZE
+        )
+        self.paths_cache: LruCache[VersionPreviewKey, list[PackageFile]] = LruCache(
+            self.CACHE_SIZE
+        )
+        self.artifact_data_cache: LruCache[VersionPreviewKey, VersionArtifactData] = (
+            LruCache(self.CACHE_SIZE)
+        )
 
     def clear_caches(self) -> None:
         self.about_urls_cache.clear()
@@ -55,6 +65,10 @@ class VersionDataLoader:
 
     @staticmethod
     def extract_rattler_build_version(rendered_recipe_text: str) -> str | None:
+        # PyYAML is only needed once a version is previewed; importing it here
+        # keeps it off the startup path.
+        import yaml
+
         data = yaml.safe_load(rendered_recipe_text)
         if not isinstance(data, dict):
             return None
@@ -90,6 +104,19 @@ class VersionDataLoader:
         self.paths_cache[preview_key] = paths
         return paths
 
+    async def _get_rattler_build_version(self, url: str) -> str | None:
+        try:
+            rendered_recipe_bytes = await fetch_raw_package_file_from_url(
+                self._client,
+                url,
+                "info/recipe/rendered_recipe.yaml",
+            )
+            return self.extract_rattler_build_version(
+                rendered_recipe_bytes.decode("utf-8", errors="replace")
+            )
+        except Exception:
+            return None
+
     async def get_about_urls(
         self, preview_key: VersionPreviewKey, url: str
     ) -> AboutUrls:
@@ -97,7 +124,12 @@ class VersionDataLoader:
         if cached is not None:
             return cached
 
-        about_json = await AboutJson.from_remote_url(self._client, url)
+        # The rendered recipe is optional, so fetch it alongside about.json
+        # instead of paying a second round-trip afterwards.
+        about_json, rattler_build_version = await asyncio.gather(
+            AboutJson.from_remote_url(self._client, url),
+            self._get_rattler_build_version(url),
+        )
         recipe_maintainers = about_json.extra.get("recipe-maintainers", [])
         if isinstance(recipe_maintainers, str):
             recipe_maintainers = [recipe_maintainers]
@@ -123,26 +155,8 @@ class VersionDataLoader:
                 if about_json.extra.get("sha")
                 else None
             ),
+            rattler_build_version=rattler_build_version,
         )
-        try:
-            rendered_recipe_bytes = await fetch_raw_package_file_from_url(
-                self._client,
-                url,
-                "info/recipe/rendered_recipe.yaml",
-            )
-            about_urls = AboutUrls(
-                repository=about_urls.repository,
-                documentation=about_urls.documentation,
-                homepage=about_urls.homepage,
-                recipe_maintainers=about_urls.recipe_maintainers,
-                provenance_remote_url=about_urls.provenance_remote_url,
-                provenance_sha=about_urls.provenance_sha,
-                rattler_build_version=self.extract_rattler_build_version(
-                    rendered_recipe_bytes.decode("utf-8", errors="replace")
-                ),
-            )
-        except Exception:
-            pass
 
         self.about_urls_cache[preview_key] = about_urls
         return about_urls
@@ -174,20 +188,30 @@ class VersionDataLoader:
         if cached is not None:
             return cached
 
-        package_paths = await self.get_package_paths(preview_key, str(record.url))
-        about_urls = AboutUrls()
-        run_exports: RunExportsJson | None = None
+        url = str(record.url)
+        # The three remote reads are independent, so overlap their round-trips
+        # on the shared client instead of awaiting them one after another.
+        package_paths, about_result, run_exports_result = await asyncio.gather(
+            self.get_package_paths(preview_key, url),
+            self.get_about_urls(preview_key, url),
+            self.get_run_exports(url),
+            return_exceptions=True,
+        )
+        if isinstance(package_paths, BaseException):
+            raise package_paths
+        for result in (about_result, run_exports_result):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
 
         # TODO: clean up once https://github.com/conda/rattler/issues/2349 is fixed.
-        try:
-            about_urls = await self.get_about_urls(preview_key, str(record.url))
-        except Exception:
-            pass
-
-        try:
-            run_exports = await self.get_run_exports(str(record.url))
-        except Exception:
-            pass
+        about_urls = (
+            about_result if isinstance(about_result, AboutUrls) else AboutUrls()
+        )
+        run_exports = (
+            run_exports_result
+            if isinstance(run_exports_result, RunExportsJson)
+            else None
+        )
 
         artifact_data = build_version_artifact_data(
             package_name,
@@ -15,6 +15,7 @@ from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
+from textual.content import Content
 from textual.events import Click, Key
 from textual.screen import ModalScreen, Screen
 from textual.widgets import Input, OptionList, Static
@@ -398,6 +399,11 @@ class VersionDetailsView(Vertical):
             "\n".join(format_version_details_metadata_lines(self._details))
         )
 
+        # Entries only depend on the details, so build them once here instead
+        # of on every dependency tab switch.
+        self._dependency_entries = {
+            tab: self._dependency_entries_for_tab(tab) for tab in DEPENDENCY_TABS
+        }
         self._refresh_dependency_section()
 
         self._section(2).update_header(self._render_section_header(2, "Files"))
@@ -416,9 +422,6 @@ class VersionDetailsView(Vertical):
         active_tab = self._active_dependency_tab()
         dependency_section = self._section(1)
         dependency_section.update_header(self._render_dependency_header())
-        self._dependency_entries = {
-            tab: self._dependency_entries_for_tab(tab) for tab in DEPENDENCY_TABS
-        }
         dependency_section.update_options(
             [entry.label for entry in self._dependency_entries[active_tab]],
             highlighted=self._dependency_highlighted[active_tab],
@@ -589,18 +592,26 @@ class MainPanel(Vertical):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._pane_selected = False
+        # The selection state the placeholder title was last drawn for, or
+        # `None` after the title was cleared.
+        self._placeholder_title_selected: bool | None = None
+        # The children live as long as the panel and are reached on nearly
+        # every key press, so they are kept here instead of queried by id.
+        self._placeholder_scroll = VerticalScroll(id="main-placeholder-scroll")
+        self._placeholder = Static(
+            "Main panel placeholder.\n\nSelect a package in the sidebar.",
+            id="main-placeholder",
+        )
+        self._version_details = VersionDetailsView()
 
     @staticmethod
     def _page_step(height: int) -> int:
         return max(1, height)
 
     def compose(self) -> ComposeResult:
-        with VerticalScroll(id="main-placeholder-scroll"):
-            yield Static(
-                "Main panel placeholder.\n\nSelect a package in the sidebar.",
-                id="main-placeholder",
-            )
-        yield VersionDetailsView()
+        with self._placeholder_scroll:
+            yield self._placeholder
+        yield self._version_details
 
     def on_mount(self) -> None:
         self.show_placeholder(
@@ -615,18 +626,19 @@ class MainPanel(Vertical):
         self.focus()
         event.stop()
 
-    def show_placeholder(self, content: str | Text) -> None:
-        placeholder = self.query_one("#main-placeholder-scroll", VerticalScroll)
+    def show_placeholder(self, content: str | Text | Content) -> None:
+        placeholder = self._placeholder_scroll
         placeholder.display = True
         self._set_placeholder_title(selected=self._pane_selected)
-        self.query_one("#main-placeholder", Static).update(content)
-        self.query_one("#version-details-view", VersionDetailsView).display = False
+        self._placeholder.update(content)
+        self._version_details.display = False
 
     def show_version_details(self, details: VersionArtifactData) -> None:
-        placeholder = self.query_one("#main-placeholder-scroll", VerticalScroll)
+        placeholder = self._placeholder_scroll
         placeholder.display = False
         placeholder.border_title = ""
-        version_details = self.query_one("#version-details-view", VersionDetailsView)
+        self._placeholder_title_selected = None
+        version_details = self._version_details
         version_details.set_details(details)
         version_details.set_pane_selected(self._pane_selected)
         version_details.display = True
@@ -634,14 +646,16 @@ class MainPanel(Vertical):
     def set_pane_selected(self, selected: bool) -> None:
         self._pane_selected = selected
         if self._showing_version_details():
-            self.query_one(
-                "#version-details-view", VersionDetailsView
-            ).set_pane_selected(selected)
+            self._version_details.set_pane_selected(selected)
         else:
             self._set_placeholder_title(selected=selected)
 
     def _set_placeholder_title(self, *, selected: bool) -> None:
-        self.query_one("#main-placeholder-scroll", VerticalScroll).border_title = Text(
+        # Assigning a border title repaints even when it is unchanged.
+        if self._placeholder_title_selected is selected:
+            return
+        self._placeholder_title_selected = selected
+        self._placeholder_scroll.border_title = Text(
             "[1] Details",
             style=ACTIVE_SECTION_TITLE_STYLE
             if selected
@@ -661,82 +675,52 @@ class MainPanel(Vertical):
         cast(CondaMetadataTui, self.app)._update_filter_indicator()
 
     def set_active_section(self, index: int) -> None:
-        self.query_one("#version-details-view", VersionDetailsView).set_active_section(
-            index
-        )
+        self._version_details.set_active_section(index)
 
     def cycle_dependency_tab(self, direction: int) -> None:
-        self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).cycle_dependency_tab(direction)
+        self._version_details.cycle_dependency_tab(direction)
 
     def dependency_section_is_active(self) -> bool:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).dependency_section_is_active()
+        return self._version_details.dependency_section_is_active()
 
     def file_section_is_active(self) -> bool:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).file_section_is_active()
+        return self._version_details.file_section_is_active()
 
     def selected_dependency_matchspec(self) -> str | None:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).selected_dependency_matchspec()
+        return self._version_details.selected_dependency_matchspec()
 
     def dependency_matchspec_at(self, index: int) -> str | None:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).dependency_matchspec_at(index)
+        return self._version_details.dependency_matchspec_at(index)
 
     def selected_file_path(self) -> str | None:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).selected_file_path()
+        return self._version_details.selected_file_path()
 
     def selected_file_size_in_bytes(self) -> int | None:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).selected_file_size_in_bytes()
+        return self._version_details.selected_file_size_in_bytes()
 
     def selected_file_sha256(self) -> bytes | None:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).selected_file_sha256()
+        return self._version_details.selected_file_sha256()
 
     def file_path_at(self, index: int) -> str | None:
-        return self.query_one("#version-details-view", VersionDetailsView).file_path_at(
-            index
-        )
+        return self._version_details.file_path_at(index)
 
     def file_size_at(self, index: int) -> int | None:
-        return self.query_one("#version-details-view", VersionDetailsView).file_size_at(
-            index
-        )
+        return self._version_details.file_size_at(index)
 
     def file_sha256_at(self, index: int) -> bytes | None:
-        return self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).file_sha256_at(index)
+        return self._version_details.file_sha256_at(index)
 
     def set_dependency_tab(self, tab: DependencyTab) -> None:
-        self.query_one("#version-details-view", VersionDetailsView).set_dependency_tab(
-            tab
-        )
+        self._version_details.set_dependency_tab(tab)
 
     def cycle_active_section(self, direction: int) -> None:
-        self.query_one(
-            "#version-details-view", VersionDetailsView
-        ).cycle_active_section(direction)
+        self._version_details.cycle_active_section(direction)
 
     def reset_scroll(self) -> None:
         if self._showing_version_details():
-            self.query_one(
-                "#version-details-view", VersionDetailsView
-            ).scroll_home_active()
+            self._version_details.scroll_home_active()
             return
-        self.query_one("#main-placeholder-scroll", VerticalScroll).scroll_home(
+        self._placeholder_scroll.scroll_home(
             animate=False,
             immediate=True,
             x_axis=False,
@@ -744,47 +728,37 @@ class MainPanel(Vertical):
 
     def scroll_main(self, delta: float) -> None:
         if self._showing_version_details():
-            self.query_one("#version-details-view", VersionDetailsView).scroll_active(
-                delta
-            )
+            self._version_details.scroll_active(delta)
             return
-        placeholder = self.query_one("#main-placeholder-scroll", VerticalScroll)
+        placeholder = self._placeholder_scroll
         placeholder.scroll_to(y=placeholder.scroll_y + delta, animate=False)
 
     def scroll_home_main(self) -> None:
         if self._showing_version_details():
-            self.query_one(
-                "#version-details-view", VersionDetailsView
-            ).scroll_home_active()
+            self._version_details.scroll_home_active()
             return
-        self.query_one("#main-placeholder-scroll", VerticalScroll).scroll_to(
+        self._placeholder_scroll.scroll_to(
             y=0,
             animate=False,
         )
 
     def scroll_end_main(self) -> None:
         if self._showing_version_details():
-            self.query_one(
-                "#version-details-view", VersionDetailsView
-            ).scroll_end_active()
+            self._version_details.scroll_end_active()
             return
-        self.query_one("#main-placeholder-scroll", VerticalScroll).scroll_end(
-            animate=False
-        )
+        self._placeholder_scroll.scroll_end(animate=False)
 
     def _showing_version_details(self) -> bool:
-        return self.query_one("#version-details-view", VersionDetailsView).display
+        return self._version_details.display
 
     def showing_version_details(self) -> bool:
         return self._showing_version_details()
 
     def current_page_step(self) -> int:
         if self._showing_version_details():
-            return self.query_one(
-                "#version-details-view", VersionDetailsView
-            ).active_page_step()
+            return self._version_details.active_page_step()
 
-        placeholder = self.query_one("#main-placeholder-scroll", VerticalScroll)
+        placeholder = self._placeholder_scroll
         return self._page_step(placeholder.size.height)
 
     def on_key(self, event: Key) -> None:
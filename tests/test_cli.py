@@ -1,4 +1,6 @@
 import re
+import subprocess
+import sys
 
 from rattler.match_spec import MatchSpec
 from rattler.platform import Platform
@@ -81,6 +83,37 @@ def test_cli_passes_channel_and_platforms(monkeypatch) -> None:
     }
 
 
+def test_cli_deduplicates_repeated_platforms(monkeypatch) -> None:
+    runner = CliRunner()
+    captured: dict[str, object] = {}
+
+    class _FakeTui:
+        def __init__(
+            self,
+            *,
+            default_channel: str = "conda-forge",
+            default_platforms: list[Platform] | None = None,
+            default_matchspec: MatchSpec | None = None,
+        ) -> None:
+            del default_channel, default_matchspec
+            captured["platforms"] = [
+                str(platform) for platform in (default_platforms or [])
+            ]
+
+        def run(self) -> None:
+            captured["run_called"] = True
+
+    monkeypatch.setattr(entrypoint, "CondaMetadataTui", _FakeTui)
+
+    result = runner.invoke(
+        entrypoint.cli,
+        ["-p", "linux-64", "-p", "noarch", "-p", "linux-64"],
+    )
+
+    assert result.exit_code == 0
+    assert captured == {"platforms": ["linux-64", "noarch"], "run_called": True}
+
+
 def test_cli_passes_matchspec(monkeypatch) -> None:
     runner = CliRunner()
     captured: dict[str, object] = {}
@@ -156,3 +189,18 @@ def test_cli_exits_for_invalid_matchspec(monkeypatch) -> None:
     assert result.exit_code == 1
     assert result.output.strip()
     assert captured == {}
+
+
+def test_entrypoint_import_defers_yaml() -> None:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pixi_browse.__main__; print('yaml' in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,136 @@
+from collections.abc import Sequence
+
+from pixi_browse import search
+from pixi_browse.search import IncrementalFuzzyRanker, fuzzy_rank, fuzzy_score
+
+PACKAGE_NAMES = [
+    "numpy",
+    "numba",
+    "numpydoc",
+    "pandas",
+    "py-numpy-financial",
+    "python",
+    "libnuma",
+    "Numexpr",
+    "scipy",
+]
+
+
+def _reference_rank(query: str, candidates: list[str]) -> list[str]:
+    scored = [
+        (score, candidate)
+        for candidate in candidates
+        if (score := fuzzy_score(query, candidate)) is not None
+    ]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [candidate for _, candidate in scored]
+
+
+def test_fuzzy_score_prefers_prefix_matches() -> None:
+    numpy_score = fuzzy_score("num", "numpy")
+    libnuma_score = fuzzy_score("num", "libnuma")
+
+    assert numpy_score is not None
+    assert libnuma_score is not None
+    assert numpy_score > libnuma_score
+    assert fuzzy_score("xyz", "numpy") is None
+    assert fuzzy_score("  ", "numpy") == 0
+
+
+def test_fuzzy_rank_matches_per_candidate_scoring() -> None:
+    for query in ("", "n", "num", "NUM", "np", "py", "numpy ", "zzz"):
+        assert fuzzy_rank(query, PACKAGE_NAMES) == _reference_rank(query, PACKAGE_NAMES)
+
+
+def test_fuzzy_rank_prefix_shortcut_matches_scorer() -> None:
+    candidates = ["numnum", "num", "NUM-extra", "nu-m", "xnum", "numpy-base", "n"]
+
+    for query in ("n", "nu", "num", "numn", "num-"):
+        assert fuzzy_rank(query, candidates) == _reference_rank(query, candidates)
+
+
+def test_fuzzy_rank_contiguous_shortcut_matches_scorer() -> None:
+    # "axab" contains "ab", but the scorer's left-to-right scan picks the
+    # first "a", so it must not be scored as a contiguous match.
+    candidates = ["axab", "xab", "xxab-ab", "a-b", "ba", "libab", "AB-x"]
+
+    for query in ("a", "ab", "b", "xab", "a-"):
+        assert fuzzy_rank(query, candidates) == _reference_rank(query, candidates)
+
+
+def test_fuzzy_rank_handles_regex_metacharacters() -> None:
+    candidates = ["c++-compiler", "libcxx", "r-base", "python-3.13"]
+
+    assert fuzzy_rank("c++", candidates) == ["c++-compiler"]
+    assert fuzzy_rank("3.1", candidates) == ["python-3.13"]
+    assert fuzzy_rank("r.", candidates) == []
+
+
+def test_fuzzy_rank_rejects_near_misses_without_backtracking() -> None:
+    # A lazy `.*?` pattern needs exponential time to reject this candidate.
+    candidates = ["c" + "a" * 50, "a" * 40 + "c"]
+
+    assert fuzzy_rank("aaaaaaaac", candidates) == ["a" * 40 + "c"]
+
+
+def test_incremental_ranker_matches_full_ranking_while_typing() -> None:
+    ranker = IncrementalFuzzyRanker()
+    for query in ("n", "nu", "num", "nump", "num", "NUMP", "np", "py", "pyn"):
+        assert ranker.rank(query, PACKAGE_NAMES) == fuzzy_rank(query, PACKAGE_NAMES)
+
+
+def test_incremental_ranker_resets_for_new_candidates() -> None:
+    ranker = IncrementalFuzzyRanker()
+    assert ranker.rank("num", PACKAGE_NAMES) == fuzzy_rank("num", PACKAGE_NAMES)
+
+    candidates = ["numcodecs", "zarr"]
+
+    assert ranker.rank("numc", candidates) == ["numcodecs"]
+    assert ranker.rank("z", candidates) == ["zarr"]
+
+
+def test_incremental_ranker_character_index_matches_full_ranking() -> None:
+    for query in ("", "mp", "pm", "nx", "Py-N", "aa", "q", "numpy q"):
+        ranker = IncrementalFuzzyRanker()
+        assert ranker.rank(query, PACKAGE_NAMES) == fuzzy_rank(query, PACKAGE_NAMES)
+
+
+def test_incremental_ranker_scans_only_the_previous_prefix_matches(
+    monkeypatch,
+) -> None:
+    ranker = IncrementalFuzzyRanker()
+    scanned: list[list[str]] = []
+    original_rank = search.fuzzy_rank
+
+    def _recording_rank(query: str, candidates: Sequence[str]) -> list[str]:
+        scanned.append(list(candidates))
+        return original_rank(query, candidates)
+
+    monkeypatch.setattr(search, "fuzzy_rank", _recording_rank)
+
+    nu_matches = ranker.rank("nu", PACKAGE_NAMES)
+    ranker.rank("num", PACKAGE_NAMES)
+    ranker.rank("nu", PACKAGE_NAMES)
+
+    assert scanned == [nu_matches]
+
+
+def test_incremental_ranker_breaks_score_ties_alphabetically() -> None:
+    # Unsorted, with equal-length names that tie on score and a duplicate.
+    candidates = ["nub", "Nua", "anu", "nuc", "bnu", "nub", "xyz", "NU"]
+
+    for query in ("n", "nu", "u", "b", "zz"):
+        ranker = IncrementalFuzzyRanker()
+        assert ranker.rank(query, candidates) == _reference_rank(query, candidates)
+
+
+def test_incremental_ranker_keeps_only_the_current_prefix_chain() -> None:
+    ranker = IncrementalFuzzyRanker()
+    for query in ("n", "nu", "num", "py", "pyt"):
+        ranker.rank(query, PACKAGE_NAMES)
+
+    assert sorted(ranker._results) == ["py", "pyt"]
+    assert sorted(ranker._char_index) == ["p", "y"]
+
+    assert ranker.rank("p", PACKAGE_NAMES) == fuzzy_rank("p", PACKAGE_NAMES)
+    assert sorted(ranker._results) == ["p"]
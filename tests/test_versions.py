@@ -1,23 +1,30 @@
 import asyncio
+import json
 import shutil
-from collections.abc import Coroutine
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
-from typing import cast
+from pathlib import Path
+from typing import Any, cast
 
 import pytest
 from rattler.exceptions import InvalidMatchSpecError
 from rattler.match_spec import MatchSpec
-from rattler.package import NoArchLiteral, RunExportsJson
+from rattler.package import NoArchLiteral, PackageName, RunExportsJson
 from rattler.platform import Platform
-from rattler.repo_data import PackageRecord, RepoDataRecord
+from rattler.repo_data import Gateway, PackageRecord, RepoDataRecord
 from rattler.version import Version
+from rich.markup import escape
 from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from textual.app import App
-from textual.events import Paste
+from textual.content import Content
+from textual.events import Paste, Resize
+from textual.geometry import Size
 from textual.widgets import Static
+from textual.widgets.option_list import Option
 
 from pixi_browse import __version__
 from pixi_browse.__main__ import CondaMetadataTui, VersionEntry, VersionRow
@@ -32,15 +39,26 @@ from pixi_browse.models import (
 from pixi_browse.rendering import (
     build_version_artifact_data,
     build_version_compare_data,
+    format_byte_size,
     format_clickable_github_handle,
     format_clickable_url,
+    format_human_byte_size,
+    format_record_value,
     format_version_details_metadata_lines,
     format_version_details_run_exports,
     render_package_preview,
 )
-from pixi_browse.repodata import MatchSpecQueryResult
+from pixi_browse.repodata import (
+    PLATFORM_PROBE_REFRESH_SECONDS,
+    MatchSpecQueryResult,
+    discover_available_platforms,
+    platform_cache_path,
+    query_many_packages,
+    read_platform_cache,
+)
 from pixi_browse.tui import (
     ACTIVE_SECTION_TITLE_STYLE,
+    DEPENDENCY_TABS,
     EMPTY_MATCHSPEC_RESULT,
     INACTIVE_SECTION_TITLE_STYLE,
     INACTIVE_SELECTED_TAB_STYLE,
@@ -59,9 +77,12 @@ from pixi_browse.tui import (
     SidebarPanel,
     VersionDetailsView,
 )
-from pixi_browse.tui.state import AboutUrls
+from pixi_browse.tui.state import AboutUrls, LruCache
 from pixi_browse.tui.version_loader import VersionDataLoader
-from pixi_browse.tui.widgets import DetailOptionList, FileActionOption
+from pixi_browse.tui.widgets import (
+    DetailOptionList,
+    FileActionOption,
+)
 
 
 @dataclass(frozen=True)
@@ -76,6 +97,7 @@ class _Record:
 @dataclass(frozen=True)
 class _RecordWithUrl:
     url: str
+    size: int | None = None
 
 
 def _make_artifact_data(
@@ -421,6 +443,48 @@ def test_load_version_details_tolerates_unavailable_about_urls(
     )
 
 
+def test_load_version_artifact_data_fetches_remote_metadata_concurrently(
+    monkeypatch,
+) -> None:
+    loader = VersionDataLoader(client=cast(Client, object()))
+    record = _make_repo_data_record(name="demo")
+    preview_key = ("demo", "1.2.3", "py313h123_0", 0, "noarch", record.file_name)
+
+    async def _run() -> VersionArtifactData:
+        run_exports_started = asyncio.Event()
+
+        async def _fake_get_package_paths(
+            _preview_key: tuple[str, str, str, int, str, str], _url: str
+        ) -> list[PackageFile]:
+            await run_exports_started.wait()
+            return [PackageFile(path="info/index.json")]
+
+        async def _fake_get_about_urls(
+            _preview_key: tuple[str, str, str, int, str, str], _url: str
+        ) -> AboutUrls:
+            return AboutUrls(homepage=("https://example.com",))
+
+        async def _fake_get_run_exports(_url: str) -> RunExportsJson:
+            run_exports_started.set()
+            return RunExportsJson(weak=["libdemo >=1"])
+
+        monkeypatch.setattr(loader, "get_package_paths", _fake_get_package_paths)
+        monkeypatch.setattr(loader, "get_about_urls", _fake_get_about_urls)
+        monkeypatch.setattr(loader, "get_run_exports", _fake_get_run_exports)
+        return await asyncio.wait_for(
+            loader.load_version_artifact_data("demo", record, preview_key=preview_key),
+            timeout=1,
+        )
+
+    artifact = asyncio.run(_run())
+
+    assert artifact.file_paths == (PackageFile(path="info/index.json"),)
+    assert artifact.homepage_urls == ("https://example.com",)
+    assert format_version_details_run_exports(artifact.run_exports) == (
+        "weak: libdemo >=1",
+    )
+
+
 def test_load_version_artifact_data_raises_when_package_paths_are_unavailable(
     monkeypatch,
 ) -> None:
@@ -679,6 +743,42 @@ def test_format_version_details_metadata_lines_include_about_urls() -> None:
     )
 
 
+def test_format_byte_size_picks_binary_units_at_boundaries() -> None:
+    assert format_byte_size(None) == "not available"
+    assert format_byte_size(1023) == "1,023 B"
+    assert format_byte_size(1024) == "1.0 KiB (1,024 bytes)"
+    assert format_byte_size(5 * 1024**2 + 1) == "5.0 MiB (5,242,881 bytes)"
+    assert format_byte_size(2 * 1024**6).startswith("2048.0 PiB")
+    assert format_human_byte_size(1536) == "1.5 KiB"
+    assert format_byte_size(-1) == "-1"
+
+
+def test_format_record_value_escapes_text_and_normalizes_noarch() -> None:
+    assert format_record_value("[bold]x") == "\\[bold]x"
+    assert format_record_value("NoArchType(None)") == "none"
+    assert format_record_value([]) == "none"
+    assert format_record_value(b"\x01\xff") == "01ff"
+
+
+def test_format_record_value_dispatches_exact_and_derived_types() -> None:
+    class _Tags(list[str]):
+        pass
+
+    assert format_record_value(None) == "not available"
+    assert format_record_value(42) == "42"
+    assert format_record_value(True) == "True"
+    assert format_record_value(["a", "b"]) == "a, b"
+    assert format_record_value(_Tags(["a"])) == "a"
+    assert format_record_value(datetime(2026, 1, 1, tzinfo=UTC)) == (
+        "2026-01-01T00:00:00+00:00"
+    )
+
+
+def test_format_record_value_escape_matches_rich_markup_escape() -> None:
+    for text in ("1.2.3", "py313h123_0", "a]b", "[x", "[/]", "trail\\", "ok\\\\"):
+        assert format_record_value(text) == escape(text)
+
+
 def test_format_clickable_url_uses_textual_click_action() -> None:
     rendered = format_clickable_url("https://example.com/demo")
 
@@ -736,6 +836,40 @@ def test_render_package_preview_shows_version_selector_preview() -> None:
     assert "Dependencies" not in rendered
 
 
+def test_render_package_preview_keeps_presorted_order_without_sort_keys() -> None:
+    records = [
+        _make_repo_data_record(
+            version=f"1.{minor}.0",
+            build="h123_0",
+            build_number=0,
+            subdir=subdir,
+            file_name=f"demo-1.{minor}.0-h123_0.conda",
+        )
+        for minor in (3, 2, 1)
+        for subdir in ("noarch", "linux-64")
+    ]
+
+    rendered = render_package_preview(
+        "demo",
+        records,
+        record_sort_key=lambda record: pytest.fail("sort key should not be used"),
+        presorted=True,
+    )
+
+    assert rendered.splitlines()[4:] == [
+        "",
+        "▾ linux-64 (3)",
+        "1.3.0 h123_0",
+        "1.2.0 h123_0",
+        "1.1.0 h123_0",
+        "",
+        "▾ noarch (3)",
+        "1.3.0 h123_0",
+        "1.2.0 h123_0",
+        "1.1.0 h123_0",
+    ]
+
+
 def test_get_package_paths_caches_remote_paths(monkeypatch) -> None:
     app = CondaMetadataTui()
     preview_key = ("demo", "1.2.3", "py313h123_0", 0, "noarch", "demo.conda")
@@ -868,6 +1002,50 @@ def test_get_about_urls_caches_remote_about_json(monkeypatch) -> None:
     assert calls == [url]
 
 
+def test_get_about_urls_fetches_rendered_recipe_concurrently(monkeypatch) -> None:
+    loader = VersionDataLoader(client=cast(Client, object()))
+    preview_key = ("demo", "1.2.3", "py313h123_0", 0, "noarch", "demo.conda")
+
+    class _FakeAboutJson:
+        dev_url: list[str] = []
+        doc_url: list[str] = []
+        home = ["https://example.com/demo"]
+        extra: dict[str, object] = {}
+
+    async def _run() -> AboutUrls:
+        recipe_started = asyncio.Event()
+
+        async def _fake_from_remote_url(client: object, url: str) -> _FakeAboutJson:
+            del client, url
+            await recipe_started.wait()
+            return _FakeAboutJson()
+
+        async def _fake_fetch_raw_package_file_from_url(
+            client: object, url: str, path: str
+        ) -> bytes:
+            del client, url, path
+            recipe_started.set()
+            return b"system_tools:\n  rattler-build: 0.38.0\n"
+
+        monkeypatch.setattr(
+            "pixi_browse.tui.version_loader.AboutJson.from_remote_url",
+            _fake_from_remote_url,
+        )
+        monkeypatch.setattr(
+            "pixi_browse.tui.version_loader.fetch_raw_package_file_from_url",
+            _fake_fetch_raw_package_file_from_url,
+        )
+        return await asyncio.wait_for(
+            loader.get_about_urls(preview_key, "https://example.invalid/demo.conda"),
+            timeout=1,
+        )
+
+    about_urls = asyncio.run(_run())
+
+    assert about_urls.homepage == ("https://example.com/demo",)
+    assert about_urls.rattler_build_version == "0.38.0"
+
+
 def test_extract_rattler_build_version_from_rendered_recipe() -> None:
     rendered_recipe = """
 context:
@@ -882,6 +1060,385 @@ package:
     assert CondaMetadataTui._extract_rattler_build_version(rendered_recipe) == "0.38.0"
 
 
+class _FakeNamesGateway:
+    def __init__(self, available: set[str]) -> None:
+        self.available = available
+        self.calls = 0
+
+    async def names(
+        self, *, sources: list[str], platforms: list[Platform]
+    ) -> list[str]:
+        self.calls += 1
+        return ["demo"] if str(platforms[0]) in self.available else []
+
+
+def test_discover_available_platforms_reuses_on_disk_probe_cache(tmp_path) -> None:
+    gateway = _FakeNamesGateway({"linux-64", "noarch"})
+
+    first = asyncio.run(
+        discover_available_platforms(
+            gateway=cast(Gateway, gateway),
+            channel_name="conda-forge",
+            cache_dir=tmp_path,
+        )
+    )
+    probe_calls = gateway.calls
+    second = asyncio.run(
+        discover_available_platforms(
+            gateway=cast(Gateway, gateway),
+            channel_name="conda-forge",
+            cache_dir=tmp_path,
+        )
+    )
+
+    assert first == [Platform("linux-64"), Platform("noarch")]
+    assert second == first
+    assert probe_calls > 0
+    assert gateway.calls == probe_calls
+    assert platform_cache_path(tmp_path, "conda-forge").is_file()
+
+
+def test_discover_available_platforms_reprobes_expired_cache(tmp_path) -> None:
+    cache_path = platform_cache_path(tmp_path, "conda-forge")
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(
+        json.dumps({"channel": "conda-forge", "timestamp": 0, "platforms": ["osx-64"]})
+    )
+    gateway = _FakeNamesGateway({"linux-64"})
+
+    platforms = asyncio.run(
+        discover_available_platforms(
+            gateway=cast(Gateway, gateway),
+            channel_name="conda-forge",
+            cache_dir=tmp_path,
+        )
+    )
+
+    assert platforms == [Platform("linux-64")]
+    assert gateway.calls > 0
+    assert json.loads(cache_path.read_text())["platforms"] == ["linux-64"]
+
+
+def test_discover_available_platforms_reprobes_cache_with_unknown_platform(
+    tmp_path,
+) -> None:
+    cache_path = platform_cache_path(tmp_path, "conda-forge")
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(
+        json.dumps(
+            {
+                "channel": "conda-forge",
+                "timestamp": time.time(),
+                "platforms": ["linux-64", "future-arch"],
+            }
+        )
+    )
+    gateway = _FakeNamesGateway({"linux-64"})
+
+    platforms = asyncio.run(
+        discover_available_platforms(
+            gateway=cast(Gateway, gateway),
+            channel_name="conda-forge",
+            cache_dir=tmp_path,
+        )
+    )
+
+    assert platforms == [Platform("linux-64")]
+    assert gateway.calls > 0
+    assert json.loads(cache_path.read_text())["platforms"] == ["linux-64"]
+
+
+def test_discover_available_platforms_refresh_bypasses_warm_cache(tmp_path) -> None:
+    cache_path = platform_cache_path(tmp_path, "conda-forge")
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(
+        json.dumps(
+            {
+                "channel": "conda-forge",
+                "timestamp": time.time() - PLATFORM_PROBE_REFRESH_SECONDS,
+                "platforms": ["osx-64"],
+            }
+        )
+    )
+    gateway = _FakeNamesGateway({"linux-64"})
+
+    cached = read_platform_cache(tmp_path, "conda-forge")
+    assert cached is not None
+    assert cached.platforms == [Platform("osx-64")]
+    assert cached.needs_refresh
+    assert read_platform_cache(tmp_path, "bioconda") is None
+
+    platforms = asyncio.run(
+        discover_available_platforms(
+            gateway=cast(Gateway, gateway),
+            channel_name="conda-forge",
+            cache_dir=tmp_path,
+            refresh=True,
+        )
+    )
+
+    assert platforms == [Platform("linux-64")]
+    refreshed = read_platform_cache(tmp_path, "conda-forge")
+    assert refreshed is not None
+    assert not refreshed.needs_refresh
+
+
+def test_discover_available_platforms_schedules_refresh_for_aging_cache(
+    monkeypatch, tmp_path
+) -> None:
+    cache_path = platform_cache_path(tmp_path, "conda-forge")
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text(
+        json.dumps(
+            {
+                "channel": "conda-forge",
+                "timestamp": time.time() - PLATFORM_PROBE_REFRESH_SECONDS,
+                "platforms": ["linux-64"],
+            }
+        )
+    )
+    app = CondaMetadataTui()
+    app._cache_dir = tmp_path
+    app._gateway = cast(Gateway, _FakeNamesGateway(set()))
+    refreshed: list[str] = []
+    read_texts: list[Path] = []
+    read_text = Path.read_text
+
+    def _read_text(path: Path, *args: Any, **kwargs: Any) -> str:
+        read_texts.append(path)
+        return read_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", _read_text)
+    monkeypatch.setattr(app, "_request_platform_probe_refresh", refreshed.append)
+
+    platforms = asyncio.run(app._discover_available_platforms())
+
+    assert platforms == [Platform("linux-64")]
+    assert refreshed == ["conda-forge"]
+    assert read_texts == [cache_path]
+
+
+def test_discover_available_platforms_probes_once_on_cache_miss(
+    monkeypatch, tmp_path
+) -> None:
+    app = CondaMetadataTui()
+    app._cache_dir = tmp_path
+    gateway = _FakeNamesGateway({"linux-64"})
+    app._gateway = cast(Gateway, gateway)
+    refreshed: list[str] = []
+    monkeypatch.setattr(app, "_request_platform_probe_refresh", refreshed.append)
+
+    platforms = asyncio.run(app._discover_available_platforms())
+
+    assert platforms == [Platform("linux-64")]
+    assert gateway.calls > 0
+    assert refreshed == []
+    assert platform_cache_path(tmp_path, "conda-forge").is_file()
+
+
+class _FakeQueryGateway:
+    def __init__(self, records: list[RepoDataRecord]) -> None:
+        self.records = records
+        self.specs: list[list[object]] = []
+
+    async def query(
+        self,
+        *,
+        sources: list[str],
+        platforms: list[Platform],
+        specs: list[object],
+        recursive: bool,
+    ) -> list[list[RepoDataRecord]]:
+        self.specs.append(list(specs))
+        requested = {str(spec) for spec in specs}
+        return [
+            [record for record in self.records if record.name.normalized in requested]
+        ]
+
+
+def test_query_many_packages_groups_records_from_one_gateway_call() -> None:
+    gateway = _FakeQueryGateway(
+        [
+            _make_repo_data_record(name="demo", version="1.0.0"),
+            _make_repo_data_record(name="demo", version="2.0.0"),
+            _make_repo_data_record(name="other", version="0.1.0"),
+        ]
+    )
+
+    records_by_package = asyncio.run(
+        query_many_packages(
+            gateway=cast(Gateway, gateway),
+            channel_name="conda-forge",
+            platforms=[Platform("noarch")],
+            package_names=["demo", "other", "missing"],
+            record_sort_key=lambda record: (
+                record.version,
+                record.build,
+                record.subdir,
+                record.build_number,
+            ),
+        )
+    )
+
+    assert gateway.specs == [["demo", "other", "missing"]]
+    assert [str(record.version) for record in records_by_package["demo"]] == [
+        "2.0.0",
+        "1.0.0",
+    ]
+    assert len(records_by_package["other"]) == 1
+    assert records_by_package["missing"] == []
+
+
+def test_prefetch_package_records_fills_cache_for_uncached_packages(
+    monkeypatch,
+) -> None:
+    app = CondaMetadataTui()
+    cached = [_make_repo_data_record(name="cached")]
+    app._package_records_cache["cached"] = cached
+    requested: list[list[str]] = []
+
+    async def _fake_query_many_packages(**kwargs: object) -> dict[str, list[object]]:
+        package_names = cast(list[str], kwargs["package_names"])
+        requested.append(list(package_names))
+        return {package_name: [] for package_name in package_names}
+
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_many_packages", _fake_query_many_packages
+    )
+
+    asyncio.run(app._prefetch_package_records(["cached", "demo", "other"]))
+
+    assert requested == [["demo", "other"]]
+    assert dict(app._package_records_cache.items()) == {
+        "cached": cached,
+        "demo": [],
+        "other": [],
+    }
+
+
+def test_prefetched_packages_are_shared_with_previews_and_neighbors(
+    monkeypatch,
+) -> None:
+    app = CondaMetadataTui()
+    app._visible_package_names = ["demo", "other", "third"]
+    requested: list[list[str]] = []
+    single: list[str] = []
+
+    async def _fake_query_many_packages(**kwargs: object) -> dict[str, list[object]]:
+        package_names = cast(list[str], kwargs["package_names"])
+        requested.append(list(package_names))
+        await asyncio.sleep(0)
+        return {package_name: [package_name] for package_name in package_names}
+
+    async def _fake_query_package_records(**kwargs: object) -> list[object]:
+        single.append(cast(str, kwargs["package_name"]))
+        return []
+
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_many_packages", _fake_query_many_packages
+    )
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_package_records", _fake_query_package_records
+    )
+
+    async def run() -> tuple[list[RepoDataRecord], list[str]]:
+        prefetch = asyncio.ensure_future(
+            app._prefetch_package_records(["demo", "other"])
+        )
+        await asyncio.sleep(0)
+        missing_neighbors = app._missing_package_records(["demo", "other", "third"])
+        records = await app._get_package_records("other")
+        await prefetch
+        return records, missing_neighbors
+
+    records, missing_neighbors = asyncio.run(run())
+
+    assert missing_neighbors == ["third"]
+    assert records == ["other"]
+    assert single == []
+    assert requested == [["demo", "other"]]
+    assert app._package_records_tasks == {}
+    assert dict(app._package_records_cache.items()) == {
+        "demo": ["demo"],
+        "other": ["other"],
+    }
+
+
+def test_sidebar_highlight_prefetches_neighbors_once_it_settles(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    app._mode = "packages"
+    app._visible_package_names = [f"pkg-{index}" for index in range(10)]
+    app._package_records_cache["pkg-4"] = []
+    workers: list[Coroutine[object, object, None]] = []
+    timers: list[Callable[[], None]] = []
+    resets: list[str] = []
+    requested: list[list[str]] = []
+
+    class _FakeTimer:
+        def reset(self) -> None:
+            resets.append("reset")
+
+    def _fake_set_timer(delay: float, callback: Callable[[], None]) -> _FakeTimer:
+        del delay
+        timers.append(callback)
+        return _FakeTimer()
+
+    async def _fake_query_many_packages(**kwargs: object) -> dict[str, list[object]]:
+        package_names = cast(list[str], kwargs["package_names"])
+        requested.append(list(package_names))
+        return {package_name: [] for package_name in package_names}
+
+    def _fake_run_worker(coro: Coroutine[object, object, None], **kwargs: object):
+        assert kwargs["group"] == "package-neighbor-prefetch"
+        workers.append(coro)
+
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_many_packages", _fake_query_many_packages
+    )
+    monkeypatch.setattr(app, "set_timer", _fake_set_timer)
+    monkeypatch.setattr(app, "run_worker", _fake_run_worker)
+    monkeypatch.setattr(app, "_request_package_preview", lambda package_name: None)
+
+    app._update_main_panel_for_sidebar_highlight(4)
+    app._update_main_panel_for_sidebar_highlight(5)
+
+    assert workers == []
+    assert len(timers) == 1
+    assert resets == ["reset"]
+
+    timers.pop()()
+    asyncio.run(workers.pop())
+
+    assert requested == [["pkg-2", "pkg-3", "pkg-5", "pkg-6", "pkg-7", "pkg-8"]]
+
+    app._update_main_panel_for_sidebar_highlight(5)
+    timers.pop()()
+
+    assert workers == []
+
+
+def test_render_package_preview_reuses_text_for_same_records(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    records = [_make_repo_data_record(name="demo")]
+    rendered: list[str] = []
+
+    def _fake_render_package_preview(package_name: str, *args, **kwargs) -> str:
+        rendered.append(package_name)
+        return f"preview {len(rendered)}"
+
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.render_package_preview", _fake_render_package_preview
+    )
+
+    first = app._render_package_preview("demo", records)
+
+    assert isinstance(first, Content)
+    assert first == "preview 1"
+    assert app._render_package_preview("demo", records) is first
+    assert app._render_package_preview("demo", list(records)) == "preview 2"
+    assert rendered == ["demo", "demo"]
+
+
 def test_ensure_available_platforms_removes_unavailable_selected_platforms() -> None:
     app = CondaMetadataTui(default_platforms={Platform("linux-64"), Platform("osx-64")})
     app._available_platform_names = [Platform("linux-64"), Platform("noarch")]
@@ -891,6 +1448,16 @@ def test_ensure_available_platforms_removes_unavailable_selected_platforms() ->
     assert app._selected_platform_names == {Platform("linux-64")}
 
 
+def test_available_platform_set_follows_replaced_list() -> None:
+    app = CondaMetadataTui()
+    app._available_platform_names = [Platform("linux-64")]
+    first = app._available_platform_set()
+
+    assert app._available_platform_set() is first
+    app._available_platform_names = [Platform("linux-64"), Platform("noarch")]
+    assert app._available_platform_set() == {Platform("linux-64"), Platform("noarch")}
+
+
 def test_ensure_available_platforms_falls_back_to_default_when_needed() -> None:
     app = CondaMetadataTui(default_platforms={Platform("osx-64")})
     app._available_platform_names = [Platform("linux-64"), Platform("noarch")]
@@ -900,6 +1467,62 @@ def test_ensure_available_platforms_falls_back_to_default_when_needed() -> None:
     assert app._selected_platform_names == {Platform("linux-64"), Platform("noarch")}
 
 
+class _OverlapNamesGateway:
+    def __init__(self, available: set[str]) -> None:
+        self.available = available
+        self.finished_probes = 0
+        self.fetches: list[tuple[list[str], int]] = []
+
+    async def names(
+        self, *, sources: list[str], platforms: list[Platform]
+    ) -> list[PackageName]:
+        if len(platforms) == 1:
+            await asyncio.sleep(0)
+            self.finished_probes += 1
+        else:
+            self.fetches.append(
+                ([str(platform) for platform in platforms], self.finished_probes)
+            )
+        return [
+            PackageName(f"demo-{platform}")
+            for platform in platforms
+            if str(platform) in self.available
+        ]
+
+
+def test_fetch_package_names_overlaps_discovery_for_requested_platforms(
+    tmp_path,
+) -> None:
+    app = CondaMetadataTui(default_platforms={Platform("linux-64"), Platform("noarch")})
+    gateway = _OverlapNamesGateway({"linux-64", "noarch", "osx-64"})
+    app._gateway = cast(Gateway, gateway)
+    app._cache_dir = tmp_path
+
+    names = asyncio.run(app._fetch_package_names_with_gateway())
+
+    assert names == ["demo-linux-64", "demo-noarch"]
+    assert app._platforms == [Platform("linux-64"), Platform("noarch")]
+    assert len(gateway.fetches) == 1
+    requested, finished_probes = gateway.fetches[0]
+    assert requested == ["linux-64", "noarch"]
+    assert finished_probes < gateway.finished_probes
+
+
+def test_fetch_package_names_refetches_when_discovery_narrows_selection(
+    tmp_path,
+) -> None:
+    app = CondaMetadataTui(default_platforms={Platform("linux-64"), Platform("osx-64")})
+    gateway = _OverlapNamesGateway({"linux-64", "noarch"})
+    app._gateway = cast(Gateway, gateway)
+    app._cache_dir = tmp_path
+
+    names = asyncio.run(app._fetch_package_names_with_gateway())
+
+    assert names == ["demo-linux-64"]
+    assert app._platforms == [Platform("linux-64")]
+    assert app._selected_platform_names == {Platform("linux-64")}
+
+
 def test_update_platform_selection_status_shows_all_selected_message(
     monkeypatch,
 ) -> None:
@@ -1075,6 +1698,35 @@ def test_open_versions_uses_matchspec_records_when_present(monkeypatch) -> None:
     ]
 
 
+def test_open_versions_orders_subdirs_with_noarch_last(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    app._matchspec_records_by_package = {
+        "demo": [
+            _make_repo_data_record(version="1.0.0", subdir=subdir)
+            for subdir in ("noarch", "osx-arm64", "linux-64", "emscripten-wasm32")
+        ]
+    }
+
+    class _FakeOptionList:
+        highlighted = 0
+        scroll_y = 0.0
+
+    monkeypatch.setattr(app, "_sidebar_list", lambda: _FakeOptionList())
+    monkeypatch.setattr(app, "_update_filter_indicator", lambda: None)
+    monkeypatch.setattr(app, "_update_versions_status", lambda: None)
+    monkeypatch.setattr(app, "_render_version_options", lambda: None)
+
+    asyncio.run(app._open_versions("demo"))
+
+    assert app._version_subdirs == [
+        "emscripten-wasm32",
+        "linux-64",
+        "osx-arm64",
+        "noarch",
+    ]
+    assert list(app._versions_by_subdir) == app._version_subdirs
+
+
 def test_open_platform_selector_no_longer_queries_removed_sidebar_title(
     monkeypatch,
 ) -> None:
@@ -1328,7 +1980,7 @@ def test_request_selected_version_preview_resets_scroll_for_cached_details(
         run_exports=RunExportsJson(weak=["run export"]),
         file_paths=(PackageFile("file"),),
     )
-    app._version_artifact_data_cache = {preview_key: cached_details}
+    app._version_artifact_data_cache[preview_key] = cached_details
     updates: list[VersionArtifactData] = []
     reset_calls: list[str] = []
     monkeypatch.setattr(
@@ -1549,9 +2201,8 @@ def test_rerender_visible_version_preview_requests_fresh_preview_when_not_cached
         run_exports=RunExportsJson(weak=["export"]),
         file_paths=(PackageFile("file"),),
     )
-    app._version_artifact_data_cache = {
-        ("demo", "1.2.3", "py313h123_0", 0, "noarch", "old"): stale_cached_details
-    }
+    stale_key = ("demo", "1.2.3", "py313h123_0", 0, "noarch", "old")
+    app._version_artifact_data_cache[stale_key] = stale_cached_details
 
     class _FakeOptionList:
         highlighted = 0
@@ -1570,8 +2221,8 @@ def test_rerender_visible_version_preview_requests_fresh_preview_when_not_cached
 
     app._rerender_visible_version_preview()
 
-    assert app._version_artifact_data_cache == {
-        ("demo", "1.2.3", "py313h123_0", 0, "noarch", "old"): stale_cached_details
+    assert dict(app._version_artifact_data_cache.items()) == {
+        stale_key: stale_cached_details
     }
     assert preview_calls == [("demo", entry)]
 
@@ -1603,7 +2254,7 @@ def test_rerender_visible_version_preview_uses_cached_details(monkeypatch) -> No
     app._mode = "versions"
     app._selected_package = "demo"
     app._version_rows = [VersionRow(kind="entry", subdir="noarch", entry=entry)]
-    app._version_artifact_data_cache = {preview_key: cached_details}
+    app._version_artifact_data_cache[preview_key] = cached_details
     shown: list[VersionArtifactData] = []
 
     class _FakeOptionList:
@@ -2205,6 +2856,34 @@ def test_dependency_list_entry_unescapes_matchspec_text() -> None:
     assert entries[0].matchspec == "demo [version='>=1']"
 
 
+def test_dependency_tab_switch_reuses_prebuilt_entries(monkeypatch) -> None:
+    view = VersionDetailsView()
+    view._details = _make_artifact_data(dependencies=("dep",))
+    view._dependency_entries = {
+        tab: view._dependency_entries_for_tab(tab) for tab in DEPENDENCY_TABS
+    }
+    updates: list[list[str]] = []
+
+    class _FakeSection:
+        def update_header(self, header) -> None:
+            pass
+
+        def update_options(self, labels, *, highlighted) -> None:
+            updates.append(labels)
+
+    monkeypatch.setattr(view, "_section", lambda index: _FakeSection())
+    monkeypatch.setattr(
+        view,
+        "_dependency_entries_for_tab",
+        lambda tab: pytest.fail("entries should not be rebuilt on tab switch"),
+    )
+
+    view.cycle_dependency_tab(1)
+    view.cycle_dependency_tab(-1)
+
+    assert updates == [["No constraints."], ["dep"]]
+
+
 def test_file_list_entry_uses_plain_file_path() -> None:
     view = VersionDetailsView()
     view._details = _make_artifact_data(
@@ -3347,50 +4026,142 @@ def test_action_channel_key_c_appends_filter_char_in_filter_mode(monkeypatch) ->
     assert appended == ["c"]
 
 
-def test_on_key_f_appends_filter_text_when_filter_mode_is_active(monkeypatch) -> None:
+class _FakeFilterTimer:
+    def __init__(self) -> None:
+        self.resets = 0
+
+    def reset(self) -> None:
+        self.resets += 1
+
+
+def test_on_key_coalesces_filter_scans_while_typing(monkeypatch) -> None:
     app = CondaMetadataTui()
     app._mode = "packages"
     app._filter_mode = True
     app._search_query = ""
     filtered: list[str] = []
     updated: list[str] = []
+    timers: list[Callable[[], None]] = []
+    timer = _FakeFilterTimer()
+
+    def _fake_set_timer(delay: float, callback: Callable[[], None]) -> _FakeFilterTimer:
+        del delay
+        timers.append(callback)
+        return timer
 
-    monkeypatch.setattr(app, "_filter_packages", lambda: filtered.append("filtered"))
     monkeypatch.setattr(
-        app, "_update_filter_indicator", lambda: updated.append("updated")
+        app, "_render_package_options", lambda: filtered.append(app._search_query)
+    )
+    monkeypatch.setattr(app, "_update_package_selection_status", lambda: None)
+    monkeypatch.setattr(app, "_show_main_placeholder", lambda value: None)
+    monkeypatch.setattr(
+        app, "_update_filter_indicator", lambda: updated.append(app._search_query)
     )
     monkeypatch.setattr(app, "_sidebar_is_focused", lambda: False)
+    monkeypatch.setattr(app, "set_timer", _fake_set_timer)
 
-    event = _FakeKeyEvent("f", "f")
-    app.on_key(event)  # type: ignore[arg-type]
-
-    assert app._search_query == "f"
-    assert filtered == ["filtered"]
-    assert updated == ["updated"]
-    assert event.stopped is True
+    for key in ("n", "u", "m", "backspace"):
+        app.on_key(_FakeKeyEvent(key, None if key == "backspace" else key))  # type: ignore[arg-type]
 
+    assert filtered == ["n"]
+    assert updated == ["n", "nu", "num", "nu"]
+    assert timer.resets == 3
 
-def test_action_channel_key_c_starts_channel_edit_mode() -> None:
-    app = CondaMetadataTui()
-    app._mode = "packages"
-    app._filter_mode = False
-    app._channel_name = "custom-channel"
-    app._channel_draft = "stale-draft"
-    app._update_filter_indicator = lambda: None  # type: ignore[method-assign]
+    timers.pop()()
 
-    app.action_channel_key_c()
+    assert filtered == ["n", "nu"]
+    assert app._filter_timer is None
 
-    assert app._channel_edit_mode is True
-    assert app._channel_draft == "custom-channel"
+    app.on_key(_FakeKeyEvent("x", "x"))  # type: ignore[arg-type]
+    assert filtered == ["n", "nu", "nux"]
+    timers.pop()()
+    assert filtered == ["n", "nu", "nux"]
 
 
-def test_on_key_uppercase_c_is_not_double_appended_in_channel_edit_mode(
-    monkeypatch,
-) -> None:
+def test_enter_opens_the_package_for_the_whole_typed_query(monkeypatch) -> None:
     app = CondaMetadataTui()
-    app._channel_edit_mode = True
-    app._channel_draft = ""
-
+    app._mode = "packages"
+    app._filter_mode = True
+    app._search_query = ""
+    app._all_package_names = ["nodejs", "numba", "numpy"]
+    opened: list[str] = []
+
+    class _FakeEvent:
+        def __init__(self) -> None:
+            self.option_list = type("OptionListEvent", (), {"id": "sidebar-list"})()
+            self.option_index = 0
+
+    async def _fake_open_versions(package_name: str) -> None:
+        opened.append(package_name)
+
+    monkeypatch.setattr(app, "_render_package_options", lambda: None)
+    monkeypatch.setattr(app, "_update_package_selection_status", lambda: None)
+    monkeypatch.setattr(app, "_show_main_placeholder", lambda value: None)
+    monkeypatch.setattr(app, "_update_filter_indicator", lambda: None)
+    monkeypatch.setattr(app, "_sidebar_is_focused", lambda: True)
+    monkeypatch.setattr(app, "set_timer", lambda delay, callback: _FakeFilterTimer())
+    monkeypatch.setattr(app, "_open_versions", _fake_open_versions)
+    monkeypatch.setattr(app, "_request_package_preview", lambda package_name: None)
+
+    for character in "numpy":
+        app.on_key(_FakeKeyEvent(character, character))  # type: ignore[arg-type]
+
+    assert app._visible_package_names[0] == "numba"
+
+    enter = _FakeKeyEvent("enter", "\r")
+    app.on_key(enter)  # type: ignore[arg-type]
+    asyncio.run(app.on_option_list_option_selected(_FakeEvent()))  # type: ignore[arg-type]
+
+    assert not enter.stopped
+    assert app._visible_package_names == ["numpy"]
+    assert opened == ["numpy"]
+
+
+def test_on_key_f_appends_filter_text_when_filter_mode_is_active(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    app._mode = "packages"
+    app._filter_mode = True
+    app._search_query = ""
+    filtered: list[str] = []
+    updated: list[str] = []
+
+    monkeypatch.setattr(app, "_filter_packages", lambda: filtered.append("filtered"))
+    monkeypatch.setattr(
+        app, "_update_filter_indicator", lambda: updated.append("updated")
+    )
+    monkeypatch.setattr(app, "_sidebar_is_focused", lambda: False)
+    monkeypatch.setattr(app, "set_timer", lambda delay, callback: _FakeFilterTimer())
+
+    event = _FakeKeyEvent("f", "f")
+    app.on_key(event)  # type: ignore[arg-type]
+
+    assert app._search_query == "f"
+    assert filtered == ["filtered"]
+    assert updated == ["updated"]
+    assert event.stopped is True
+
+
+def test_action_channel_key_c_starts_channel_edit_mode() -> None:
+    app = CondaMetadataTui()
+    app._mode = "packages"
+    app._filter_mode = False
+    app._channel_name = "custom-channel"
+    app._channel_draft = "stale-draft"
+    app._update_filter_indicator = lambda: None  # type: ignore[method-assign]
+
+    app.action_channel_key_c()
+
+    assert app._channel_edit_mode is True
+    assert app._channel_draft == "custom-channel"
+
+
+def test_on_key_uppercase_c_is_not_double_appended_in_channel_edit_mode(
+    monkeypatch,
+) -> None:
+    app = CondaMetadataTui()
+    app._channel_edit_mode = True
+    app._channel_draft = ""
+
     monkeypatch.setattr(app, "_sidebar_is_focused", lambda: False)
     monkeypatch.setattr(app, "_update_filter_indicator", lambda: None)
 
@@ -3410,6 +4181,7 @@ def test_on_key_uppercase_c_is_not_double_appended_in_filter_mode(monkeypatch) -
     app._sidebar_is_focused = lambda: False  # type: ignore[method-assign]
     monkeypatch.setattr(app, "_filter_packages", lambda: None)
     monkeypatch.setattr(app, "_update_filter_indicator", lambda: None)
+    monkeypatch.setattr(app, "set_timer", lambda delay, callback: _FakeFilterTimer())
 
     app.action_compare_key_c()
     event = _FakeKeyEvent("C", "C")
@@ -4079,6 +4851,25 @@ def test_footer_text_highlights_compare_hint_when_compare_a_is_stored() -> None:
     )
 
 
+def test_chrome_texts_follow_their_inputs() -> None:
+    app = CondaMetadataTui()
+    app._mode = "versions"
+    app._selected_package = "demo"
+
+    title = app._sidebar_title_text(selected=True)
+
+    assert cast(Text, app._footer_text()).plain.endswith("Download: d | Help: ?")
+    assert title.plain == "[0] Versions: demo"
+
+    app._download_indicator_override = "Downloading demo..."
+    assert cast(Text, app._footer_text()).plain.endswith(
+        "Downloading demo... | Help: ?"
+    )
+    assert app._sidebar_title_text(selected=False).style != title.style
+    app._selected_package = "other"
+    assert app._sidebar_title_text(selected=True).plain == "[0] Versions: other"
+
+
 def test_footer_text_shows_compare_keybinds_when_compare_screen_is_open() -> None:
     app = CondaMetadataTui()
     app._compare_screen_open = True
@@ -4117,6 +4908,34 @@ def test_footer_text_resets_in_versions_mode_even_with_active_search() -> None:
     )
 
 
+def test_on_resize_schedules_one_sidebar_refresh_per_burst(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    scheduled: list[Callable[[], None]] = []
+    refreshed: list[str] = []
+
+    monkeypatch.setattr(app, "_update_filter_indicator", lambda: None)
+    monkeypatch.setattr(
+        app, "call_after_refresh", lambda callback: scheduled.append(callback)
+    )
+    monkeypatch.setattr(app, "_sidebar_list", lambda: _FakeSidebarList())
+    monkeypatch.setattr(
+        app,
+        "_render_package_options",
+        lambda *, preserve_position: refreshed.append("packages"),
+    )
+
+    for _ in range(3):
+        app.on_resize(Resize(Size(80, 24), Size(80, 24)))
+
+    assert len(scheduled) == 1
+
+    scheduled.pop()()
+    app.on_resize(Resize(Size(100, 24), Size(100, 24)))
+
+    assert refreshed == ["packages"]
+    assert len(scheduled) == 1
+
+
 def test_on_paste_appends_sanitized_text_in_channel_edit_mode() -> None:
     app = CondaMetadataTui()
     app._channel_edit_mode = True
@@ -4603,3 +5422,582 @@ def test_download_selected_version_entry_downloads_to_cwd_and_notifies(
         in footer_updates
     )
     assert notifications == [f"Downloaded successfully to {destination}"]
+
+
+class _FakeSidebarList:
+    def __init__(self) -> None:
+        self.options: list[str] = []
+        self.highlighted: int | None = None
+        self.scroll_y = 0.0
+        self.size = Size(40, 20)
+
+    def clear_options(self) -> None:
+        self.options.clear()
+        self.highlighted = None
+
+    def add_option(self, option: str) -> None:
+        self.options.append(option)
+
+    def add_options(self, options: list[str | Option]) -> None:
+        # Record the prompts as they are shown.
+        self.options.extend(
+            str(option.prompt) if isinstance(option, Option) else option
+            for option in options
+        )
+
+    def action_first(self) -> None:
+        self.highlighted = 0
+
+    def scroll_to(self, *, y: float, animate: bool) -> None:
+        del animate
+        self.scroll_y = y
+
+
+def test_render_package_options_lists_visible_names(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    option_list = _FakeSidebarList()
+    monkeypatch.setattr(app, "_sidebar_list", lambda: option_list)
+
+    app._visible_package_names = ["numpy", "numba", "pandas"]
+    app._render_package_options()
+    option_list.highlighted = 2
+    app._render_package_options(preserve_position=True)
+
+    assert option_list.options == ["numpy", "numba", "pandas"]
+    assert option_list.highlighted == 2
+
+    app._render_package_options()
+
+    assert option_list.highlighted == 0
+
+    option_list.highlighted = 2
+    app._visible_package_names = ["numba", "numpy"]
+    app._render_package_options(preserve_position=True)
+
+    assert option_list.options == ["numba", "numpy"]
+    assert option_list.highlighted == 1
+
+    app._visible_package_names = []
+    app._render_package_options()
+
+    assert option_list.options == ["No packages found"]
+
+
+def test_filter_packages_follows_query_and_candidate_changes(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    option_list = _FakeSidebarList()
+    monkeypatch.setattr(app, "_sidebar_list", lambda: option_list)
+    monkeypatch.setattr(app, "_update_package_selection_status", lambda: None)
+    monkeypatch.setattr(app, "_request_package_preview", lambda package_name: None)
+
+    app._all_package_names = ["numpy", "numba", "pandas"]
+    app._filter_packages()
+    app._filter_mode = True
+    app._filter_packages()
+
+    assert app._visible_package_names == ["numpy", "numba", "pandas"]
+
+    app._search_query = "num"
+    app._filter_packages()
+    app._filter_packages()
+
+    assert app._visible_package_names == ["numba", "numpy"]
+    assert option_list.options == ["numba", "numpy"]
+
+    app._all_package_names = ["numcodecs", "zarr"]
+    app._filter_packages()
+
+    assert app._visible_package_names == ["numcodecs"]
+    assert option_list.options == ["numcodecs"]
+
+    app._search_query = ""
+    app._filter_packages()
+
+    assert option_list.options == ["numcodecs", "zarr"]
+
+
+def _make_versions_app(monkeypatch) -> tuple[CondaMetadataTui, _FakeSidebarList]:
+    app = CondaMetadataTui()
+    sidebar = _FakeSidebarList()
+    entries_by_subdir = {
+        subdir: [
+            VersionEntry(
+                version=Version(f"1.{minor}.0"),
+                build="h123_0",
+                build_number=0,
+                subdir=subdir,
+                file_name=f"demo-1.{minor}.0-h123_0.conda",
+            )
+            for minor in (2, 1)
+        ]
+        for subdir in ("linux-64", "noarch")
+    }
+    app._mode = "versions"
+    app._version_subdirs = list(entries_by_subdir)
+    app._versions_by_subdir = entries_by_subdir
+    app._current_versions = [
+        entry for entries in entries_by_subdir.values() for entry in entries
+    ]
+    monkeypatch.setattr(app, "query_one", lambda *_args: sidebar)
+    return app, sidebar
+
+
+def test_find_version_section_index_uses_rendered_section_rows(monkeypatch) -> None:
+    app, _sidebar = _make_versions_app(monkeypatch)
+
+    app._render_version_options()
+
+    assert app._find_version_section_index("linux-64") == 1
+    assert app._find_version_section_index("noarch") == 4
+    assert app._find_version_section_index("osx-64") is None
+    assert all(
+        app._version_rows[index] == VersionRow(kind="section", subdir=subdir)
+        for subdir, index in app._version_section_row_index.items()
+    )
+
+
+def test_version_rows_follow_sidebar_width_and_entries(monkeypatch) -> None:
+    app, sidebar = _make_versions_app(monkeypatch)
+
+    app._render_version_options()
+
+    assert sidebar.options[2:4] == [
+        "1.2.0" + " " * 25 + "h123_0",
+        "1.1.0" + " " * 25 + "h123_0",
+    ]
+
+    sidebar.size = Size(30, 20)
+    app._render_version_options(preserve_position=True)
+
+    assert sidebar.options[2] == "1.2.0" + " " * 15 + "h123_0"
+
+    sidebar.size = Size(10, 20)
+    app._render_version_options(preserve_position=True)
+
+    assert sidebar.options[2] == "1.2.0" + " " * 5 + "h123_0"
+
+    app._versions_by_subdir = {
+        **app._versions_by_subdir,
+        "linux-64": [
+            VersionEntry(
+                version=Version("2.0.0"),
+                build="py313h123_0",
+                build_number=0,
+                subdir="linux-64",
+                file_name="demo-2.0.0-py313h123_0.conda",
+            )
+        ],
+    }
+    app._render_version_options()
+
+    assert sidebar.options[1:4] == [
+        "▾ linux-64 (1)",
+        "2.0.0 py313h123_0",
+        "▾ noarch (2)",
+    ]
+
+
+def test_toggle_version_section_keeps_the_section_in_view(monkeypatch) -> None:
+    app, sidebar = _make_versions_app(monkeypatch)
+    app._render_version_options()
+    sidebar.scroll_y = 3.0
+
+    app._toggle_version_section("linux-64")
+
+    assert sidebar.options == [
+        "< Back to packages",
+        "▸ linux-64 (2)",
+        "▾ noarch (2)",
+        "1.2.0" + " " * 25 + "h123_0",
+        "1.1.0" + " " * 25 + "h123_0",
+    ]
+    assert sidebar.highlighted == 1
+    assert sidebar.scroll_y == 3.0
+    assert app._find_version_section_index("noarch") == 2
+
+    app._toggle_version_section("linux-64")
+
+    assert sidebar.options == [
+        "< Back to packages",
+        "▾ linux-64 (2)",
+        "1.2.0" + " " * 25 + "h123_0",
+        "1.1.0" + " " * 25 + "h123_0",
+        "▾ noarch (2)",
+        "1.2.0" + " " * 25 + "h123_0",
+        "1.1.0" + " " * 25 + "h123_0",
+    ]
+    assert len(app._version_rows) == 7
+    assert sidebar.highlighted == 1
+
+
+def test_channel_snapshot_shares_containers_that_are_replaced_on_clear(
+    monkeypatch,
+) -> None:
+    app, _sidebar = _make_versions_app(monkeypatch)
+    app._render_version_options()
+    app._toggle_version_section("noarch")
+    app._package_records_cache["demo"] = []
+    versions_by_subdir = app._versions_by_subdir
+    version_rows = list(app._version_rows)
+
+    snapshot = app._snapshot_channel_state()
+    app._clear_version_state()
+    app._clear_record_caches()
+    app._toggle_version_section("linux-64")
+
+    assert snapshot.versions_by_subdir is versions_by_subdir
+    assert dict(snapshot.package_records_cache.items()) == {"demo": []}
+    assert snapshot.collapsed_version_subdirs == {"noarch"}
+    assert snapshot.version_rows == version_rows
+    assert app._versions_by_subdir == {}
+    assert len(app._package_records_cache) == 0
+
+    app._restore_channel_state(snapshot)
+
+    assert app._versions_by_subdir is versions_by_subdir
+    assert app._find_version_section_index("noarch") == 4
+
+
+def test_lru_cache_evicts_least_recently_used_entries() -> None:
+    cache: LruCache[str, int] = LruCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    assert cache.get("a") == 1
+    cache["c"] = 3
+
+    assert "b" not in cache
+    assert dict(cache.items()) == {"a": 1, "c": 3}
+
+    cache["d"] = 4
+
+    assert cache.get("a") is None
+    assert cache.pop("c") == 3
+    assert dict(cache.items()) == {"d": 4}
+
+    cache.update({"e": 5, "f": 6, "g": 7})
+
+    assert dict(cache.items()) == {"f": 6, "g": 7}
+
+
+def test_package_records_cache_is_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(CondaMetadataTui, "PACKAGE_RECORDS_CACHE_SIZE", 2)
+    app = CondaMetadataTui()
+    records: list[RepoDataRecord] = []
+
+    async def _fake_query_package_records(**kwargs: object) -> list[RepoDataRecord]:
+        return records
+
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_package_records", _fake_query_package_records
+    )
+    for package_name in ("a", "b", "a", "c"):
+        asyncio.run(app._get_package_records(package_name))
+
+    assert dict(app._package_records_cache.items()) == {"a": records, "c": records}
+
+
+def test_package_records_query_survives_a_superseded_waiter(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    records: list[RepoDataRecord] = []
+    queries: list[str] = []
+
+    async def _fake_query_package_records(**kwargs: object) -> list[RepoDataRecord]:
+        queries.append(cast(str, kwargs["package_name"]))
+        await asyncio.sleep(0.01)
+        return records
+
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_package_records", _fake_query_package_records
+    )
+
+    async def run() -> list[RepoDataRecord]:
+        superseded = asyncio.create_task(app._get_package_records("demo"))
+        await asyncio.sleep(0)
+        superseded.cancel()
+        shared = await app._get_package_records("demo")
+        assert superseded.cancelled()
+        return shared
+
+    assert asyncio.run(run()) is records
+    assert queries == ["demo"]
+    assert app._package_records_cache.get("demo") is records
+    assert app._package_records_tasks == {}
+
+
+def test_package_records_queries_are_cancelled_with_the_cache(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    started: list[str] = []
+
+    async def _fake_query_package_records(**kwargs: object) -> list[RepoDataRecord]:
+        started.append(cast(str, kwargs["package_name"]))
+        await asyncio.Event().wait()
+        return []
+
+    async def _fake_query_many_packages(**kwargs: object) -> dict[str, list[object]]:
+        started.extend(cast(list[str], kwargs["package_names"]))
+        await asyncio.Event().wait()
+        return {}
+
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_package_records", _fake_query_package_records
+    )
+    monkeypatch.setattr(
+        "pixi_browse.tui.app.query_many_packages", _fake_query_many_packages
+    )
+
+    async def run() -> list[asyncio.Task[Any]]:
+        waiter = asyncio.create_task(app._get_package_records("demo"))
+        prefetch = asyncio.create_task(app._prefetch_package_records(["other"]))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        pending = list(app._package_records_pending)
+        assert started == ["demo", "other"]
+
+        app._clear_record_caches()
+        await asyncio.gather(waiter, prefetch, return_exceptions=True)
+
+        assert app._package_records_tasks == {}
+        assert app._package_records_pending == set()
+
+        late = asyncio.create_task(app._get_package_records("late"))
+        await asyncio.sleep(0)
+        pending.extend(app._package_records_pending)
+        app.on_unmount()
+        await asyncio.gather(late, return_exceptions=True)
+        return pending
+
+    pending = asyncio.run(run())
+
+    assert len(pending) == 4
+    assert all(task.cancelled() for task in pending)
+
+
+def test_selected_platforms_text_sorts_by_name_with_noarch_last() -> None:
+    app = CondaMetadataTui(
+        default_platforms={
+            Platform("noarch"),
+            Platform("win-64"),
+            Platform("linux-64"),
+            Platform("osx-arm64"),
+        }
+    )
+
+    assert app._selected_platforms_text() == "linux-64, osx-arm64, win-64, noarch"
+    assert app._selected_platforms_text() is app._selected_platforms_text()
+
+    app._selected_platform_names = {Platform("osx-64")}
+
+    assert app._selected_platforms_text() == "osx-64"
+
+
+def test_render_platform_options_marks_draft_selection(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    sidebar = _FakeSidebarList()
+    monkeypatch.setattr(app, "query_one", lambda *_args: sidebar)
+    app._available_platform_names = [Platform("linux-64"), Platform("noarch")]
+    app._draft_selected_platform_names = {Platform("noarch")}
+
+    app._render_platform_options()
+
+    assert sidebar.options == ["  linux-64", "✓ noarch"]
+
+
+def test_get_record_for_version_entry_indexes_records_once(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    records = [
+        _make_repo_data_record(version="1.0.0", subdir="linux-64"),
+        _make_repo_data_record(version="1.0.0", subdir="noarch"),
+        _make_repo_data_record(version="2.0.0", subdir="noarch"),
+    ]
+    app._matchspec_records_by_package = {"demo": records}
+    entries = app._build_version_entries(records)
+
+    found = [
+        asyncio.run(app._get_record_for_version_entry("demo", entry))
+        for entry in entries
+    ]
+    cached = app._record_index_cache.get("demo")
+    assert cached is not None
+
+    assert len(found) == len(records)
+    for entry, record in zip(entries, found, strict=True):
+        assert record is not None
+        assert (record.subdir, record.file_name) == (entry.subdir, entry.file_name)
+    assert app._record_index_cache.get("demo") is cached
+
+    stale_entry = replace(entries[0], build_number=entries[0].build_number + 1)
+    assert asyncio.run(app._get_record_for_version_entry("demo", stale_entry)) is None
+
+
+def test_download_progress_is_read_from_partial_file(monkeypatch, tmp_path) -> None:
+    app = CondaMetadataTui()
+    destination = tmp_path / "demo.conda.part"
+    indicators: list[str | None] = []
+    monkeypatch.setattr(app, "_set_download_indicator", indicators.append)
+    monkeypatch.setattr("pixi_browse.tui.app._DOWNLOAD_PROGRESS_INTERVAL_SECONDS", 0.01)
+
+    async def _fake_download() -> None:
+        destination.write_bytes(b"x" * 1024)
+        await asyncio.sleep(0.05)
+        destination.write_bytes(b"x" * 4096)
+
+    async def _run() -> None:
+        await app._await_download_with_progress(
+            asyncio.ensure_future(_fake_download()),
+            file_name="demo.conda",
+            destination=destination,
+            total_size=4096,
+        )
+
+    asyncio.run(_run())
+
+    assert indicators
+    assert indicators[0] == "Downloading demo.conda... 1.0 KiB / 4.0 KiB (25%)"
+    assert CondaMetadataTui._download_progress_text("demo.conda", 10, None) == (
+        "Downloading demo.conda... 10 B"
+    )
+
+
+def test_download_progress_cancels_download_when_interrupted(tmp_path) -> None:
+    app = CondaMetadataTui()
+    started = asyncio.Event()
+
+    async def _slow_download() -> None:
+        started.set()
+        await asyncio.sleep(10)
+
+    async def _run() -> asyncio.Future[None]:
+        download = asyncio.ensure_future(_slow_download())
+        waiter = asyncio.ensure_future(
+            app._await_download_with_progress(
+                download,
+                file_name="demo.conda",
+                destination=tmp_path / "missing.part",
+                total_size=None,
+            )
+        )
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+        return download
+
+    download = asyncio.run(_run())
+
+    assert download.cancelled()
+
+
+def test_request_package_preview_debounces_uncached_queries(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    started: list[str] = []
+    timers: list[Callable[[], None]] = []
+    resets: list[str] = []
+
+    class _FakeTimer:
+        def reset(self) -> None:
+            resets.append("reset")
+
+    def _fake_set_timer(delay: float, callback: Callable[[], None]) -> _FakeTimer:
+        del delay
+        timers.append(callback)
+        return _FakeTimer()
+
+    def _fake_run_worker(coro: object, **kwargs: object) -> None:
+        del kwargs
+        coro.close()  # type: ignore[attr-defined]
+
+    monkeypatch.setattr(app, "set_timer", _fake_set_timer)
+    monkeypatch.setattr(app, "run_worker", _fake_run_worker)
+    monkeypatch.setattr(app, "_show_main_placeholder", lambda value: None)
+    original_start = app._start_package_preview_query
+
+    def _recording_start(package_name: str) -> None:
+        started.append(package_name)
+        original_start(package_name)
+
+    monkeypatch.setattr(app, "_start_package_preview_query", _recording_start)
+
+    for package_name in ("a", "b", "c", "d"):
+        app._request_package_preview(package_name)
+
+    assert started == ["a"]
+    assert resets == ["reset"] * 3
+    assert len(timers) == 1
+
+    timers.pop()()
+
+    assert started == ["a", "d"]
+    assert len(timers) == 1
+
+    app._request_package_preview("c")
+    app._request_package_preview("d")
+    timers.pop()()
+
+    assert started == ["a", "d"]
+    assert timers == []
+
+
+def test_update_filter_indicator_skips_unchanged_chrome(monkeypatch) -> None:
+    app = CondaMetadataTui()
+
+    class _FakeBordered:
+        def __init__(self) -> None:
+            self.assignments: list[str] = []
+            self.styles = type("_Styles", (), {})()
+
+        def __setattr__(self, name: str, value: object) -> None:
+            if name.startswith("border_"):
+                self.assignments.append(name)
+            object.__setattr__(self, name, value)
+
+        def set_class(self, add: bool, name: str) -> None:
+            del add, name
+
+        def set_pane_selected(self, selected: bool) -> None:
+            del selected
+
+    class _FakeFooter:
+        def __init__(self) -> None:
+            self.updates: list[object] = []
+
+        def update(self, value: object) -> None:
+            self.updates.append(value)
+
+    sidebar = _FakeBordered()
+    main_panel = _FakeBordered()
+    footer = _FakeFooter()
+    widgets = {"#sidebar": sidebar, "#main-panel": main_panel, "#footer": footer}
+    monkeypatch.setattr(
+        app, "query_one", lambda selector, _widget_type=None: widgets[selector]
+    )
+
+    app._update_filter_indicator()
+    app._update_filter_indicator()
+
+    assert sidebar.assignments == ["border_title", "border_subtitle"]
+    assert main_panel.assignments == ["border_title", "border_subtitle"]
+    assert len(footer.updates) == 1
+
+    app._selected_pane = "main"
+    app._update_filter_indicator()
+
+    assert sidebar.assignments == ["border_title", "border_subtitle", "border_title"]
+    assert len(footer.updates) == 1
+
+
+def test_hot_widgets_are_queried_once(monkeypatch) -> None:
+    app = CondaMetadataTui()
+    queried: list[str] = []
+    sidebar = _FakeSidebarList()
+
+    def _fake_query_one(selector: str, _widget_type: object = None) -> object:
+        queried.append(selector)
+        return sidebar
+
+    monkeypatch.setattr(app, "query_one", _fake_query_one)
+
+    assert app._sidebar_list() is sidebar
+    assert app._sidebar_list() is sidebar
+    assert queried == ["#sidebar-list"]